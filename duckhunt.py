@@ -4,31 +4,42 @@ Commands: !bang, !reload, !shop, !rearm, !disarm
 """
 
 import asyncio
-import json
 import sys
-import os
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from src.config_loader import load_config
 
-from src.duckhuntbot import DuckHuntBot
+
+def _run(coro):
+    """Run the bot's main coroutine, on uvloop's event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
 
 
 def main():
     """Main entry point for DuckHunt Bot"""
     try:
+        # A missing file surfaces as FileNotFoundError (handled below), so there's
+        # no separate exists() check racing the actual open.
         config_file = 'config.json'
-        if not os.path.exists(config_file):
-            print("❌ config.json not found!")
-            sys.exit(1)
-            
-        with open(config_file) as f:
-            config = json.load(f)
-        
+        config = load_config(config_file)
+
+        # Imported only once the config is loaded, so a missing/broken config.json
+        # fails fast without first paying for the bot's full import graph.
+        from src.duckhuntbot import DuckHuntBot
+
         bot = DuckHuntBot(config)
         bot.logger.info("Starting DuckHunt Bot...")
         
         # Run the bot
-        asyncio.run(bot.run())
+        _run(bot.run())
         
     except KeyboardInterrupt:
         print("\n🛑 Shutdown interrupted by user")
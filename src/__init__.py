@@ -0,0 +1,3 @@
+"""
+DuckHunt Bot package
+"""
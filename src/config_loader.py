@@ -0,0 +1,46 @@
+"""
+Configuration loading for DuckHunt Bot
+Parses config.json once per file version and serves repeat loads from memory
+"""
+
+import functools
+import logging
+import os
+
+from .serialization import loads
+
+# Configs this large are almost certainly a mistake (e.g. a data dump pasted in)
+_LARGE_CONFIG_BYTES = 16 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=4)
+def _load(path: str, mtime_ns: int, size: int) -> dict:
+    """Read and parse the config file. `mtime_ns` and `size` come from the caller's
+    stat() and also form the cache key.
+    """
+    # Read the whole file with one syscall straight into bytes; config.json is small
+    # enough that the buffered/text I/O layers are pure overhead here.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        buf = os.read(fd, size)
+    finally:
+        os.close(fd)
+    return loads(buf)
+
+
+def load_config(path: str = "config.json") -> dict:
+    """Load and parse a config file, reusing the previous result if it is unchanged.
+
+    The cache is keyed on the file's modification time, so edits to config.json
+    are always picked up. The returned dict is shared between callers and must be
+    treated as read-only. Raises FileNotFoundError if the file does not exist and
+    ValueError if it is empty.
+    """
+    st = os.stat(path)
+    if st.st_size == 0:
+        raise ValueError(f"{path} is empty")
+    if st.st_size > _LARGE_CONFIG_BYTES:
+        logging.getLogger("DuckHuntBot.Config").warning(
+            "%s is larger than 16MB (%d bytes); consider splitting it", path, st.st_size
+        )
+    return _load(path, st.st_mtime_ns, st.st_size)
@@ -3,6 +3,8 @@ Enhanced Database management for DuckHunt Bot
 Focus on fixing missing field errors with improved error handling
 """
 
+import asyncio
+import heapq
 import json
 import logging
 import os
@@ -13,6 +15,12 @@ from datetime import datetime
 from typing import Any, Dict, Generator, Optional, Tuple
 
 from .error_handling import ErrorRecovery, RetryConfig, sanitize_user_input, with_retry
+from .serialization import DecodeError, dumps, dumps_pretty, loads
+
+# Inventory item IDs accepted when neither the shop nor shop.json is available. Keep
+# in sync with shop.json's item IDs (1: ammo, 2: magazine, 4: clean_gun,
+# 5: attract_ducks, 7: buy_gun_back, 13: temporary_accuracy, 14: xp_shield).
+FALLBACK_ITEM_IDS = frozenset({"1", "2", "4", "5", "7", "13", "14"})
 
 
 class DuckDB:
@@ -48,6 +56,41 @@ class DuckDB:
         # what flush_pending_saves() waits on (bounded by its timeout).
         self._last_save_future = None
 
+        # Set while saver_loop() is running: request_save() then only flags a save
+        # and the loop coalesces every request made within `save_delay` into one.
+        self._save_event = None
+        self.save_delay = 0.5
+
+        # Incremental saves: each save diffs the sanitized payload against the previous
+        # one and appends only the changed player records to `<db_file>.journal`. A full
+        # snapshot is rewritten on the first save of the process, every
+        # `journal_snapshot_every` journaled saves, and after any failed write. Each save
+        # is one journal line (a batch) tagged with the generation of the snapshot it
+        # extends; only whole batches matching the snapshot on disk are replayed at
+        # load, so stale or torn batches are never applied, not even in part.
+        self.journal_file = f"{self.db_file}.journal"
+        # The journal that extends the `.bak` snapshot, rotated out with it
+        self.journal_backup_file = f"{self.journal_file}.bak"
+        self.journal_snapshot_every = 100
+        self._saved_players = None
+        self._journal_generation = None
+        self._journal_saves = 0
+        # Failed writes are counted by the save thread and noticed by the next save
+        self._failed_saves = 0
+        self._failed_saves_seen = 0
+
+        # (channel_key, nick) -> the player dict most recently validated for that slot.
+        # get_player only re-runs the full sanitize pass when the stored record is a
+        # different object (freshly loaded from disk, replaced, ...), so the common
+        # case hands back the live record instead of rebuilding ~40 fields per command.
+        self._validated_players = {}
+
+        # shop.json's item IDs, read on first use if no live shop is attached yet
+        self._shop_file_item_ids = None
+
+        # Defaults for new players, resolved once; create_player copies it
+        self._player_template = self._build_player_template()
+
         data = self.load_database()
         # Hydrate in-memory state from disk.
         if isinstance(data, dict) and isinstance(data.get("channels"), dict):
@@ -85,13 +128,15 @@ class DuckDB:
             if not nick_lower:
                 return False
 
+            # nick_lower is already sanitized, so look the records up directly
+            # rather than through get_player_if_exists (which would sanitize again)
             # Channel-scoped ignore
-            player = self.get_player_if_exists(nick_lower, channel)
-            if isinstance(player, dict) and bool(player.get("ignored", False)):
+            player = self._existing_player(nick_lower, channel)
+            if player is not None and bool(player.get("ignored", False)):
                 return True
 
             # Global ignore bucket
-            global_player = self.get_player_if_exists(nick_lower, "__global__")
+            global_player = self._existing_player(nick_lower, "__global__")
             return bool(global_player and global_player.get("ignored", False))
         except Exception:
             return False
@@ -161,15 +206,15 @@ class DuckDB:
                 )
                 return self._create_default_database()
 
-            with open(self.db_file, "r") as f:
+            with open(self.db_file, "rb") as f:
                 content = f.read().strip()
 
             if not content:
                 return self._recover_or_default("Database file is empty")
 
             try:
-                data = json.loads(content)
-            except json.JSONDecodeError as e:
+                data = loads(content)
+            except (DecodeError, ValueError) as e:
                 return self._recover_or_default(
                     f"Database file contains invalid JSON: {e}"
                 )
@@ -183,8 +228,11 @@ class DuckDB:
         except Exception as e:
             return self._recover_or_default(f"Unexpected error loading database: {e}")
 
-    def _normalize_loaded_data(self, data: dict) -> dict:
-        """Apply metadata init + legacy migration to a freshly parsed database dict."""
+    def _normalize_loaded_data(
+        self, data: dict, journal_file: Optional[str] = None
+    ) -> dict:
+        """Apply metadata init + legacy migration to a freshly parsed database dict,
+        then replay `journal_file` (the live journal by default) on top of it."""
         # Initialize metadata if missing
         if "metadata" not in data:
             data["metadata"] = {
@@ -230,6 +278,8 @@ class DuckDB:
         # Update last_modified
         data["metadata"]["last_modified"] = datetime.now().isoformat()
 
+        self._replay_journal(data, journal_file or self.journal_file)
+
         total_players = 0
         try:
             for _c, cdata in data.get("channels", {}).items():
@@ -242,6 +292,57 @@ class DuckDB:
         )
         return data
 
+    def _replay_journal(self, data: dict, journal_file: str) -> None:
+        """Apply journaled player records written since the loaded snapshot.
+
+        Each line is one save's batch of records, applied all-or-nothing. Only batches
+        tagged with the snapshot's `journal_generation` are applied; batches left over
+        from older snapshots, or torn by a crash mid-append, are skipped whole, so a
+        multi-player change (a gift, say) is never replayed halfway.
+        """
+        generation = data.get("journal_generation")
+        if generation is None or not os.path.exists(journal_file):
+            return
+        applied = 0
+        try:
+            with open(journal_file, "rb") as f:
+                for line in f:
+                    try:
+                        batch = loads(line)
+                    except (DecodeError, ValueError):
+                        continue
+                    if not isinstance(batch, dict) or batch.get("gen") != generation:
+                        continue
+                    entries = batch.get("entries")
+                    if not isinstance(entries, list):
+                        continue
+                    for entry in entries:
+                        if not isinstance(entry, dict):
+                            continue
+                        channel_key = entry.get("channel")
+                        nick = entry.get("nick")
+                        if not isinstance(channel_key, str) or not isinstance(
+                            nick, str
+                        ):
+                            continue
+                        bucket = data["channels"].setdefault(
+                            channel_key, {"players": {}}
+                        )
+                        if not isinstance(bucket, dict):
+                            continue
+                        players = bucket.setdefault("players", {})
+                        if not isinstance(players, dict):
+                            continue
+                        if isinstance(entry.get("player"), dict):
+                            players[nick] = entry["player"]
+                        else:
+                            players.pop(nick, None)
+                        applied += 1
+        except Exception as e:
+            self.logger.error(f"Error replaying database journal: {e}")
+        if applied:
+            self.logger.info(f"Replayed {applied} journaled player updates")
+
     def _recover_or_default(self, reason: str) -> dict:
         """Handle an unreadable primary database file without ever discarding data.
 
@@ -297,19 +398,20 @@ class DuckDB:
             return None
 
     def _try_load_backup(self) -> Optional[dict]:
-        """Attempt to load the rolling .bak snapshot written before the last successful save."""
+        """Attempt to load the rolling .bak snapshot written before the last successful
+        save, together with the journal that was extending it at the time."""
         backup_path = f"{self.db_file}.bak"
         if not os.path.exists(backup_path):
             return None
         try:
-            with open(backup_path, "r", encoding="utf-8") as f:
+            with open(backup_path, "rb") as f:
                 content = f.read().strip()
             if not content:
                 return None
-            data = json.loads(content)
+            data = loads(content)
             if not isinstance(data, dict):
                 return None
-            return self._normalize_loaded_data(data)
+            return self._normalize_loaded_data(data, self.journal_backup_file)
         except Exception as e:
             self.logger.error(f"Backup file {backup_path} is also unreadable: {e}")
             return None
@@ -325,8 +427,8 @@ class DuckDB:
                 "description": "DuckHunt Bot Player Database",
             }
 
-            with open(self.db_file, "w", encoding="utf-8") as f:
-                json.dump(default_data, f, indent=2, ensure_ascii=False, sort_keys=True)
+            with open(self.db_file, "wb") as f:
+                f.write(dumps_pretty(default_data))
 
             self.logger.info(f"Created new database file: {self.db_file}")
             return default_data
@@ -372,6 +474,38 @@ class DuckDB:
             result = max(min_val, result)
         return result
 
+    def _valid_item_ids(self) -> frozenset:
+        """Item IDs (as strings) allowed in a sanitized inventory.
+
+        Prefers the live shop's ID set, which is rebuilt only when the shop reloads.
+        Before the shop exists (e.g. while loading the database at startup), shop.json
+        is read directly - once, not once per player.
+        """
+        shop = getattr(self.bot, "shop", None) if self.bot else None
+        if shop:
+            try:
+                if shop.item_ids:
+                    return shop.item_ids
+            except Exception:
+                pass
+
+        if self._shop_file_item_ids is None:
+            try:
+                shop_path = os.path.join(
+                    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                    "shop.json",
+                )
+                with open(shop_path, "r", encoding="utf-8") as f:
+                    shop_data = json.load(f)
+                self._shop_file_item_ids = frozenset(
+                    str(k) for k in shop_data.get("items", {}).keys()
+                )
+            except Exception:
+                self._shop_file_item_ids = frozenset()
+
+        # Last-resort fallback if shop.json is also unavailable
+        return self._shop_file_item_ids or FALLBACK_ITEM_IDS
+
     def _sanitize_player_data(self, player_data):
         """Sanitize and validate player data, ensuring ALL required fields exist.
 
@@ -485,30 +619,7 @@ class DuckDB:
             # directly (same file/location shop.py loads from), and only fall back to a
             # hardcoded snapshot as a last resort - this avoids the hardcoded list quietly
             # drifting out of sync with shop.json as items are added/removed/renumbered.
-            valid_ids = None
-            if self.bot and hasattr(self.bot, "shop") and self.bot.shop:
-                try:
-                    valid_ids = {str(k) for k in self.bot.shop.get_items().keys()}
-                except Exception:
-                    valid_ids = None
-
-            if not valid_ids:
-                try:
-                    shop_path = os.path.join(
-                        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                        "shop.json",
-                    )
-                    with open(shop_path, "r", encoding="utf-8") as f:
-                        shop_data = json.load(f)
-                    valid_ids = {str(k) for k in shop_data.get("items", {}).keys()}
-                except Exception:
-                    valid_ids = None
-
-            if not valid_ids:
-                # Last-resort fallback if shop.json is also unavailable. Keep in sync with
-                # shop.json's item IDs (1: ammo, 2: magazine, 4: clean_gun, 5: attract_ducks,
-                # 7: buy_gun_back, 13: temporary_accuracy, 14: xp_shield).
-                valid_ids = {"1", "2", "4", "5", "7", "13", "14"}
+            valid_ids = self._valid_item_ids()
 
             for k, v in inventory.items():
                 try:
@@ -584,6 +695,8 @@ class DuckDB:
     def save_database(self) -> bool:
         """Persist all player data to disk.
 
+        Only players whose saved form changed since the last save are written, as
+        journal appends; the whole file is rewritten periodically (see `__init__`).
         Builds the sanitized save payload synchronously on the calling thread (fast,
         in-memory, no I/O - so there's no risk of the background thread iterating
         `self.channels` while it's concurrently mutated). The actual disk write -
@@ -599,12 +712,17 @@ class DuckDB:
         """
         try:
             data = self._build_save_payload()
+            job = self._plan_save(data)
         except Exception as e:
             self.logger.error(f"Error preparing database for save: {e}")
             return False
+        if job is None:
+            # Nothing changed since the last save
+            return True
+        write, payload = job
 
         try:
-            future = self._save_executor.submit(self._write_database_to_disk, data)
+            future = self._save_executor.submit(write, payload)
             future.add_done_callback(self._log_save_result)
             self._last_save_future = future
             return True
@@ -616,16 +734,87 @@ class DuckDB:
                 f"Save executor unavailable ({e}); writing synchronously instead."
             )
             try:
-                return self._write_database_to_disk(data)
+                return write(payload)
             except Exception as e2:
+                self._failed_saves += 1
                 self.logger.error(f"Synchronous fallback save failed: {e2}")
                 return False
 
+    def request_save(self) -> None:
+        """Ask for the current state to be persisted soon.
+
+        With saver_loop() running, a burst of game actions costs one save_database()
+        call instead of one each. Without it (tests, scripts) this saves immediately.
+        """
+        if self._save_event is not None:
+            self._save_event.set()
+        else:
+            self.save_database()
+
+    async def saver_loop(self) -> None:
+        """Long-lived task that performs the saves flagged by request_save().
+
+        A request still pending when the task is cancelled is covered by the
+        shutdown path's own final save_database() call.
+        """
+        self._save_event = asyncio.Event()
+        try:
+            while True:
+                await self._save_event.wait()
+                await asyncio.sleep(self.save_delay)
+                self._save_event.clear()
+                self.save_database()
+        finally:
+            self._save_event = None
+
+    def _plan_save(self, data: dict):
+        """Decide how to persist a freshly built save payload.
+
+        Returns `(write_func, payload)` for the save thread - a full snapshot or a
+        journal append of just the changed players - or None if nothing changed.
+        """
+        current = {
+            (channel_key, nick): player
+            for channel_key, channel_data in data["channels"].items()
+            for nick, player in channel_data["players"].items()
+        }
+        previous = self._saved_players
+        self._saved_players = current
+
+        failed = self._failed_saves
+        if (
+            previous is None
+            or failed != self._failed_saves_seen
+            or self._journal_saves >= self.journal_snapshot_every
+        ):
+            self._failed_saves_seen = failed
+            self._journal_saves = 0
+            self._journal_generation = time.time_ns()
+            data["journal_generation"] = self._journal_generation
+            return self._write_database_to_disk, data
+
+        entries = [
+            {"channel": key[0], "nick": key[1], "player": player}
+            for key, player in current.items()
+            if previous.get(key) != player
+        ]
+        entries.extend(
+            {"channel": key[0], "nick": key[1], "player": None}
+            for key in previous.keys() - current.keys()
+        )
+        if not entries:
+            return None
+        self._journal_saves += 1
+        batch = {"gen": self._journal_generation, "entries": entries}
+        return self._append_to_journal, batch
+
     def _log_save_result(self, future) -> None:
         """Done-callback for background saves: surface any failure to the logs."""
         try:
             future.result()
         except Exception as e:
+            # Forces the next save to be a full snapshot
+            self._failed_saves += 1
             self.logger.error(f"Background database save failed: {e}")
 
     def flush_pending_saves(self, timeout: float = 10.0) -> None:
@@ -706,23 +895,26 @@ class DuckDB:
 
         try:
             # Write to temporary file first (atomic write)
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+            payload = dumps_pretty(data)
+            with open(temp_file, "wb") as f:
+                f.write(payload)
                 f.flush()
                 os.fsync(f.fileno())
 
-            # Verify temp file was written correctly
-            try:
-                with open(temp_file, "r", encoding="utf-8") as f:
-                    json.load(f)  # Verify it's valid JSON
-            except json.JSONDecodeError:
-                raise IOError("Temporary file contains invalid JSON")
+            # Verify temp file was written correctly. The payload came from the
+            # encoder, so a byte-for-byte match is a stricter check than parsing
+            # the whole file back.
+            with open(temp_file, "rb") as f:
+                if f.read() != payload:
+                    raise IOError("Temporary file does not match the written data")
 
             # Keep a rolling backup of the last known-good file before replacing it, so a
             # corrupted/interrupted write can never take down the only copy of the data.
+            backed_up = False
             if os.path.exists(self.db_file):
                 try:
                     shutil.copy2(self.db_file, f"{self.db_file}.bak")
+                    backed_up = True
                 except Exception as e:
                     self.logger.warning(f"Could not update .bak backup file: {e}")
 
@@ -730,6 +922,20 @@ class DuckDB:
             # on Windows if the destination already exists).
             os.replace(temp_file, self.db_file)
 
+            # Everything journaled so far is part of the new snapshot, but it is also
+            # what extends the old snapshot now in .bak - so the journal moves to
+            # .journal.bak with it, and recovering from the backup loses nothing. This
+            # only happens after the replace: until then the primary still needs it.
+            # Lines from older generations are ignored at load anyway, so if there is
+            # no fresh backup to pair with, emptying the file just keeps it small.
+            try:
+                if backed_up and os.path.exists(self.journal_file):
+                    os.replace(self.journal_file, self.journal_backup_file)
+                else:
+                    open(self.journal_file, "w").close()
+            except OSError as e:
+                self.logger.warning(f"Could not rotate database journal: {e}")
+
             self.logger.debug("Database saved successfully")
             return True
 
@@ -744,6 +950,24 @@ class DuckDB:
             except Exception:
                 pass
 
+    @with_retry(
+        RetryConfig(max_attempts=3, base_delay=0.5, max_delay=5.0),
+        exceptions=(OSError, PermissionError, IOError),
+    )
+    def _append_to_journal(self, batch: dict) -> bool:
+        """Append one save's changed player records to the journal as a single line
+        (runs on the save thread).
+
+        Each batch starts on a fresh line, so a batch torn by a crash only ever loses
+        itself - it no longer parses and is skipped whole at replay - and never
+        corrupts the next batch.
+        """
+        with open(self.journal_file, "ab") as f:
+            f.write(b"\n" + dumps(batch) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return True
+
     def get_players_for_channel(self, channel: str) -> Dict[str, Any]:
         """Get the players dict for a channel, creating the channel bucket if needed."""
         channel_key = self._normalize_channel(channel)
@@ -781,18 +1005,21 @@ class DuckDB:
             nick_lower = nick_clean.lower().strip()
             if not nick_lower:
                 return None
-            channel_key = self._normalize_channel(channel)
-            channel_data = self.channels.get(channel_key)
-            if not isinstance(channel_data, dict):
-                return None
-            players = channel_data.get("players")
-            if not isinstance(players, dict):
-                return None
-            player = players.get(nick_lower)
-            return player if isinstance(player, dict) else None
+            return self._existing_player(nick_lower, channel)
         except Exception:
             return None
 
+    def _existing_player(self, nick_lower: str, channel: str) -> Optional[dict]:
+        """Look up an existing record by an already-sanitized, lowercased nick."""
+        channel_data = self.channels.get(self._normalize_channel(channel))
+        if not isinstance(channel_data, dict):
+            return None
+        players = channel_data.get("players")
+        if not isinstance(players, dict):
+            return None
+        player = players.get(nick_lower)
+        return player if isinstance(player, dict) else None
+
     def get_player(self, nick: str, channel: str) -> dict:
         """Get player data for a specific channel, creating if doesn't exist with comprehensive validation"""
         try:
@@ -818,12 +1045,16 @@ class DuckDB:
                 return self.create_player("Unknown")
 
             players = self.get_players_for_channel(channel)
+            slot = (self._normalize_channel(channel), nick_lower)
 
             if nick_lower not in players:
                 players[nick_lower] = self.create_player(nick_clean)
             else:
                 # Ensure existing players have all required fields
                 player = players[nick_lower]
+                if self._validated_players.get(slot) is player:
+                    player["nick"] = nick_clean
+                    return player
                 if not isinstance(player, dict):
                     self.logger.warning(
                         f"Invalid player data for {nick_lower}, recreating"
@@ -840,6 +1071,7 @@ class DuckDB:
                     )
                     players[nick_lower] = validated
 
+            self._validated_players[slot] = players[nick_lower]
             return players[nick_lower]
 
         except Exception as e:
@@ -881,69 +1113,77 @@ class DuckDB:
 
         return validated_player
 
+    def _build_player_template(self) -> Dict[str, Any]:
+        """Build the default record for a new player from the bot's config."""
+        # Get configurable defaults from bot config
+        if self.bot:
+            accuracy = self.bot.get_config("player_defaults.accuracy", 75)
+            magazines = self.bot.get_config("player_defaults.magazines", 3)
+            bullets_per_mag = self.bot.get_config(
+                "player_defaults.bullets_per_magazine", 6
+            )
+            jam_chance = self.bot.get_config("player_defaults.jam_chance", 15)
+            xp = self.bot.get_config("player_defaults.xp", 0)
+        else:
+            accuracy = 75
+            magazines = 3
+            bullets_per_mag = 6
+            jam_chance = 15
+            xp = 0
+
+        return {
+            "nick": "Unknown",
+            "xp": xp,
+            "ducks_shot": 0,
+            "ducks_befriended": 0,
+            "shots_fired": 0,
+            "shots_missed": 0,
+            "current_ammo": bullets_per_mag,
+            "magazines": magazines,
+            "bullets_per_magazine": bullets_per_mag,
+            "accuracy": accuracy,
+            "jam_chance": jam_chance,
+            "gun_confiscated": False,
+            "confiscated_ammo": 0,
+            "confiscated_magazines": 0,
+            "inventory": {},
+            "temporary_effects": [],
+            "last_activity_channel": "",
+            "last_activity_time": 0.0,
+            "ignored": False,
+            "best_time": 0.0,
+            "worst_time": 0.0,
+            "total_time_hunting": 0.0,
+            "level": 1,
+            "xp_gained": 0,
+            "hp_remaining": 0,
+            "victim": "",
+            "xp_lost": 0,
+            # Streak & achievements
+            "current_streak": 0,
+            "best_streak": 0,
+            "achievements": [],
+            # Daily bonus
+            "last_daily": 0.0,
+            "daily_streak": 0,
+            "last_daily_date": "",
+            # Bang cooldown
+            "last_bang_time": 0.0,
+            # Economy tracking
+            "total_xp_spent": 0,
+            "gun_confiscated_count": 0,
+        }
+
     def create_player(self, nick: str) -> Dict[str, Any]:
         """Create a new player with all required fields"""
         try:
-            safe_nick = str(nick)[:50] if nick else "Unknown"
-
-            # Get configurable defaults from bot config
-            if self.bot:
-                accuracy = self.bot.get_config("player_defaults.accuracy", 75)
-                magazines = self.bot.get_config("player_defaults.magazines", 3)
-                bullets_per_mag = self.bot.get_config(
-                    "player_defaults.bullets_per_magazine", 6
-                )
-                jam_chance = self.bot.get_config("player_defaults.jam_chance", 15)
-                xp = self.bot.get_config("player_defaults.xp", 0)
-            else:
-                accuracy = 75
-                magazines = 3
-                bullets_per_mag = 6
-                jam_chance = 15
-                xp = 0
-
-            return {
-                "nick": safe_nick,
-                "xp": xp,
-                "ducks_shot": 0,
-                "ducks_befriended": 0,
-                "shots_fired": 0,
-                "shots_missed": 0,
-                "current_ammo": bullets_per_mag,
-                "magazines": magazines,
-                "bullets_per_magazine": bullets_per_mag,
-                "accuracy": accuracy,
-                "jam_chance": jam_chance,
-                "gun_confiscated": False,
-                "confiscated_ammo": 0,
-                "confiscated_magazines": 0,
-                "inventory": {},
-                "temporary_effects": [],
-                "last_activity_channel": "",
-                "last_activity_time": 0.0,
-                "ignored": False,
-                "best_time": 0.0,
-                "worst_time": 0.0,
-                "total_time_hunting": 0.0,
-                "level": 1,
-                "xp_gained": 0,
-                "hp_remaining": 0,
-                "victim": "",
-                "xp_lost": 0,
-                # Streak & achievements
-                "current_streak": 0,
-                "best_streak": 0,
-                "achievements": [],
-                # Daily bonus
-                "last_daily": 0.0,
-                "daily_streak": 0,
-                "last_daily_date": "",
-                # Bang cooldown
-                "last_bang_time": 0.0,
-                # Economy tracking
-                "total_xp_spent": 0,
-                "gun_confiscated_count": 0,
-            }
+            player = dict(self._player_template)
+            player["nick"] = str(nick)[:50] if nick else "Unknown"
+            # The template's containers must never be shared between players
+            player["inventory"] = {}
+            player["temporary_effects"] = []
+            player["achievements"] = []
+            return player
         except Exception as e:
             self.logger.error(f"Error creating player for {nick}: {e}")
             return {
@@ -993,8 +1233,9 @@ class DuckDB:
                 value = self._safe_int(player_data.get(category, 0), 0, min_val=0)
                 leaderboard.append((nick, value))
 
-            leaderboard.sort(key=lambda x: x[1], reverse=True)
-            return leaderboard[:limit]
+            # Same result as sort(reverse=True)[:limit], ties included, without
+            # sorting every player to show a handful of rows
+            return heapq.nlargest(limit, leaderboard, key=lambda x: x[1])
 
         except Exception as e:
             self.logger.error(f"Error getting leaderboard for {category}: {e}")
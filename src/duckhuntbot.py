@@ -1,5 +1,10 @@
 import asyncio
+import datetime
+import fnmatch
+import heapq
 import os
+import random
+import re
 import signal
 import ssl
 import sys
@@ -15,11 +20,22 @@ from .error_handling import (
 )
 from .game import DuckGame
 from .levels import LevelManager
-from .logging_utils import setup_logger
+from .logging_utils import setup_logger, stop_file_listeners
 from .sasl import SASLHandler
 from .shop import ShopManager
 from .utils import MessageManager, parse_irc_message
 
+# Commands that draw from the per-nick token bucket in _execute_command_safely
+RATE_LIMITED_COMMANDS = frozenset({"bang", "bef", "befriend", "shop", "use"})
+
+# Python 3.12+: starts a task eagerly, running it up to its first real wait inside
+# the call. Used only for outgoing-message tasks (see _track_task); None before 3.12.
+_EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+
+# Cached marker for get_config paths that do not resolve, so each call still gets
+# its own default
+_MISSING = object()
+
 
 class DuckHuntBot:
     def __init__(self, config):
@@ -61,7 +77,8 @@ class DuckHuntBot:
         self.db = DuckDB(bot=self)
         self.game = DuckGame(self, self.db)
         # Rate limiting state: per-nick token buckets to slow scripted abuse
-        # Structure: {nick_lower: {'tokens': float, 'last_refill': float}}
+        # Structure: {nick_lower: [tokens, last_refill]} - a two-slot list rather than a
+        # dict, since one exists per active nick and is touched on every limited command
         self._rate_limiters = {}
         # Default rate-limit configuration (can be overridden via config.json)
         self._rl_capacity = float(self.get_config("anti_abuse.rate_limit_capacity", 3))
@@ -85,7 +102,7 @@ class DuckHuntBot:
             or any(c.isspace() for c in raw_prefix)
         ):
             self.logger.warning(
-                f"Invalid commands.prefix {raw_prefix!r} in config; falling back to '!'"
+                "Invalid commands.prefix %r in config; falling back to '!'", raw_prefix
             )
             raw_prefix = "!"
         self.command_prefix = raw_prefix
@@ -110,23 +127,10 @@ class DuckHuntBot:
         # Set up health checks
         self._setup_health_checks()
 
-        admins_list = self.get_config("admins", ["colby"]) or ["colby"]
-        if not isinstance(admins_list, list):
-            admins_list = ["colby"]
-        self.admins = []
-        nick_only_admins = []
-        for admin_entry in admins_list:
-            if isinstance(admin_entry, str):
-                self.admins.append(admin_entry.lower())
-                nick_only_admins.append(admin_entry)
-            elif isinstance(admin_entry, dict):
-                entry_nick = admin_entry.get("nick", "")
-                if isinstance(entry_nick, str) and entry_nick:
-                    self.admins.append(entry_nick.lower())
-                    if not admin_entry.get("hostmask"):
-                        nick_only_admins.append(entry_nick)
+        # self.admins and self._admin_rules are (re)built by the config setter
+        admins, nick_only_admins = self._admin_nicks()
         self.logger.info(
-            f"Configured {len(self.admins)} admin(s): {', '.join(self.admins)}"
+            "Configured %s admin(s): %s", len(admins), ', '.join(admins)
         )
         if nick_only_admins:
             self.logger.warning(
@@ -152,6 +156,8 @@ class DuckHuntBot:
         # Command dispatch table: cmd -> (admin_only, handler). Built last so every
         # subsystem the handlers reference already exists.
         self.command_handlers = self._build_command_table()
+        # IRC command/numeric -> handler, so handle_message is one dict lookup
+        self.irc_handlers = self._build_irc_table()
 
     def _build_command_table(self):
         """Map command name -> (admin_only, handler).
@@ -194,6 +200,39 @@ class DuckHuntBot:
             "part": (True, lambda n, c, p, a, u: self.handle_part_channel(n, c, a)),
         }
 
+    def _build_irc_table(self):
+        """Map IRC command/numeric -> handler for handle_message.
+
+        All handlers share the signature (prefix, command, params, trailing); the
+        SASL entries adapt to SASLHandler's methods, looked up at call time.
+        """
+
+        def sasl_result(prefix, command, params, trailing):
+            return self.sasl_handler.handle_sasl_result(command, params, trailing)
+
+        table = {
+            "CAP": lambda pr, c, p, t: self.sasl_handler.handle_cap_response(p, t),
+            "AUTHENTICATE": lambda pr, c, p, t: (
+                self.sasl_handler.handle_authenticate_response(p)
+            ),
+            "001": self._on_welcome,
+            "JOIN": self._on_join,
+            "PRIVMSG": self._on_privmsg,
+            "KICK": self._on_kick,
+            "PING": self._on_ping,
+        }
+        for numeric in ("903", "904", "905", "906", "907", "908"):
+            table[numeric] = sasl_result
+        for numeric in ("433", "436"):
+            table[numeric] = self._on_nick_in_use
+        # JOIN failures: no such channel, too many channels, full, invite-only,
+        # banned, bad key, needs registration, and target/nick change throttles
+        for numeric in (
+            "403", "405", "437", "471", "473", "474", "475", "477", "438", "439"
+        ):
+            table[numeric] = self._on_join_failed
+        return table
+
     def _setup_health_checks(self):
         """Set up health monitoring checks"""
         try:
@@ -220,17 +259,54 @@ class DuckHuntBot:
 
             self.logger.debug("Health checks configured")
         except Exception as e:
-            self.logger.error(f"Error setting up health checks: {e}")
+            self.logger.error("Error setting up health checks: %s", e)
+
+    @property
+    def config(self):
+        return self._config
+
+    @config.setter
+    def config(self, config):
+        # Resolved get_config paths are only valid for the dict they were read from
+        self._config = config
+        self._config_cache = {}
+        # Admin matching is derived from config too, so it must follow reassignment
+        self.admins = frozenset(self._admin_nicks()[0])
+        self._admin_rules = self._build_admin_rules()
+
+    def _admin_nicks(self):
+        """Return (lowercased admin nicks, nicks authenticated by nick alone) from the
+        `admins` config, in config order."""
+        admins_list = self.get_config("admins", ["colby"]) or ["colby"]
+        if not isinstance(admins_list, list):
+            admins_list = ["colby"]
+        admins = []
+        nick_only_admins = []
+        for admin_entry in admins_list:
+            if isinstance(admin_entry, str):
+                admins.append(admin_entry.lower())
+                nick_only_admins.append(admin_entry)
+            elif isinstance(admin_entry, dict):
+                entry_nick = admin_entry.get("nick", "")
+                if isinstance(entry_nick, str) and entry_nick:
+                    admins.append(entry_nick.lower())
+                    if not admin_entry.get("hostmask"):
+                        nick_only_admins.append(entry_nick)
+        return admins, nick_only_admins
 
     def get_config(self, path, default=None):
-        keys = path.split(".")
-        value = self.config
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        return value
+        try:
+            value = self._config_cache[path]
+        except KeyError:
+            value = self.config
+            for key in path.split("."):
+                if isinstance(value, dict) and key in value:
+                    value = value[key]
+                else:
+                    value = _MISSING
+                    break
+            self._config_cache[path] = value
+        return default if value is _MISSING else value
 
     def _channel_key(self, channel: str) -> str:
         """Normalize channel for internal comparisons (IRC channels are case-insensitive)."""
@@ -241,45 +317,62 @@ class DuckHuntBot:
             return channel.lower()
         return channel
 
-    def is_admin(self, user):
-        if "!" not in user:
-            return False
-
-        nick = user.split("!")[0].lower()
+    def _build_admin_rules(self):
+        """Index the `admins` config by lowercased nick for is_admin.
 
+        Maps nick -> (hostmask, compiled hostmask regex), or (None, None) for nick-only
+        entries. The first entry for a nick wins, as with the old linear scan.
+        """
         admin_config = self.get_config("admins", [])
         if not isinstance(admin_config, list):
             admin_config = []
 
+        rules = {}
         for admin_entry in admin_config:
             if isinstance(admin_entry, str):
-                if admin_entry.lower() == nick:
-                    self.logger.warning(
-                        f"Admin access granted via nick-only authentication: {user}"
-                    )
-                    return True
+                if admin_entry:
+                    rules.setdefault(admin_entry.lower(), (None, None))
             elif isinstance(admin_entry, dict):
-                if admin_entry.get("nick", "").lower() == nick:
-                    required_pattern = admin_entry.get("hostmask")
-                    if required_pattern:
-                        import fnmatch
-
-                        if fnmatch.fnmatch(user.lower(), required_pattern.lower()):
-                            self.logger.info(
-                                f"Admin access granted via hostmask: {user}"
-                            )
-                            return True
-                        else:
-                            self.logger.warning(
-                                f"Admin nick match but hostmask mismatch: {user} vs {required_pattern}"
-                            )
-                            return False
-                    else:
-                        self.logger.warning(
-                            f"Admin access granted via nick-only (no hostmask configured): {user}"
-                        )
-                        return True
+                entry_nick = admin_entry.get("nick", "")
+                if not isinstance(entry_nick, str) or not entry_nick:
+                    continue
+                required_pattern = admin_entry.get("hostmask")
+                if required_pattern:
+                    rules.setdefault(
+                        entry_nick.lower(),
+                        (
+                            required_pattern,
+                            re.compile(fnmatch.translate(required_pattern.lower())),
+                        ),
+                    )
+                else:
+                    rules.setdefault(entry_nick.lower(), (None, None))
+        return rules
+
+    def is_admin(self, user):
+        if "!" not in user:
+            return False
+
+        nick = user.split("!")[0].lower()
+
+        rule = self._admin_rules.get(nick)
+        if rule is None:
+            return False
 
+        required_pattern, hostmask_re = rule
+        if hostmask_re is None:
+            self.logger.warning(
+                "Admin access granted via nick-only authentication: %s", user
+            )
+            return True
+        if hostmask_re.match(user.lower()):
+            self.logger.info("Admin access granted via hostmask: %s", user)
+            return True
+        self.logger.warning(
+            "Admin nick match but hostmask mismatch: %s vs %s",
+            user,
+            required_pattern,
+        )
         return False
 
     def _get_admin_target_player(self, nick, channel, target_nick):
@@ -293,9 +386,9 @@ class DuckHuntBot:
         calling this, otherwise the lookup would silently land in the shared '__pm__' bucket
         and operate on a phantom player disconnected from the player's real channel data.
         """
-        if target_nick.lower() == nick.lower():
-            target_nick = target_nick.lower()
-            player = self.db.get_player(target_nick, channel)
+        target_nick_lower = target_nick.lower()
+        if target_nick_lower == nick.lower():
+            player = self.db.get_player(target_nick_lower, channel)
             return player, None
         else:
             is_valid, player, error_msg = self.validate_target_player(
@@ -325,7 +418,7 @@ class DuckHuntBot:
         def signal_handler(signum, _frame):
             signal_name = "SIGINT" if signum == signal.SIGINT else "SIGTERM"
             self.logger.info(
-                f"Received {signal_name} (Ctrl+C), shutting down immediately..."
+                "Received %s (Ctrl+C), shutting down immediately...", signal_name
             )
             self.shutdown_requested = True
             try:
@@ -333,9 +426,9 @@ class DuckHuntBot:
                 tasks = [t for t in asyncio.all_tasks(loop) if not t.done()]
                 for task in tasks:
                     task.cancel()
-                self.logger.info(f"Cancelled {len(tasks)} running tasks")
+                self.logger.info("Cancelled %s running tasks", len(tasks))
             except Exception as e:
-                self.logger.error(f"Error cancelling tasks: {e}")
+                self.logger.error("Error cancelling tasks: %s", e)
 
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
@@ -366,7 +459,11 @@ class DuckHuntBot:
                 server = self.get_config("connection.server", "irc.libera.chat")
                 port = self.get_config("connection.port", 6667)
                 self.logger.info(
-                    f"Attempting to connect to {server}:{port} (attempt {attempt + 1}/{max_retries})"
+                    "Attempting to connect to %s:%s (attempt %s/%s)",
+                    server,
+                    port,
+                    attempt + 1,
+                    max_retries,
                 )
 
                 self.reader, self.writer = await asyncio.wait_for(
@@ -374,24 +471,24 @@ class DuckHuntBot:
                     timeout=self.get_config("connection.timeout", 30) or 30.0,
                 )
 
-                self.logger.info(f"Successfully connected to {server}:{port}")
+                self.logger.info("Successfully connected to %s:%s", server, port)
                 return
 
             except asyncio.TimeoutError:
                 self.logger.error(
-                    f"Connection attempt {attempt + 1} timed out after 30 seconds"
+                    "Connection attempt %s timed out after 30 seconds", attempt + 1
                 )
             except ssl.SSLError as e:
-                self.logger.error(f"SSL error on attempt {attempt + 1}: {e}")
+                self.logger.error("SSL error on attempt %s: %s", attempt + 1, e)
             except OSError as e:
-                self.logger.error(f"Network error on attempt {attempt + 1}: {e}")
+                self.logger.error("Network error on attempt %s: %s", attempt + 1, e)
             except Exception as e:
                 self.logger.error(
-                    f"Unexpected connection error on attempt {attempt + 1}: {e}"
+                    "Unexpected connection error on attempt %s: %s", attempt + 1, e
                 )
 
             if attempt < max_retries - 1:
-                self.logger.info(f"Retrying connection in {retry_delay} seconds...")
+                self.logger.info("Retrying connection in %s seconds...", retry_delay)
                 await asyncio.sleep(retry_delay)
                 retry_delay *= 2
 
@@ -399,13 +496,28 @@ class DuckHuntBot:
 
     def send_raw(self, msg):
         """Send raw IRC message with error handling"""
+        return self._write_raw(f"{msg}\r\n".encode("utf-8", errors="replace"))
+
+    def send_raw_lines(self, msgs):
+        """Send several raw IRC lines with a single transport write.
+
+        Meant for unpaced control bursts (registration, autojoin). Chat output must
+        keep going through _paced_send_raw so flood pacing still applies.
+        """
+        if not msgs:
+            return True
+        return self._write_raw(
+            b"".join(f"{msg}\r\n".encode("utf-8", errors="replace") for msg in msgs)
+        )
+
+    def _write_raw(self, payload):
+        """Write already-encoded IRC line(s) to the connection"""
         if not self.writer or self.writer.is_closing():
-            self.logger.warning(f"Cannot send message: connection not available")
+            self.logger.warning("Cannot send message: connection not available")
             return False
 
         try:
-            encoded_msg = f"{msg}\r\n".encode("utf-8", errors="replace")
-            self.writer.write(encoded_msg)
+            self.writer.write(payload)
             return True
         except ConnectionResetError:
             self.logger.error("Connection reset while sending message")
@@ -414,10 +526,10 @@ class DuckHuntBot:
             self.logger.error("Broken pipe while sending message")
             return False
         except OSError as e:
-            self.logger.error(f"Network error while sending message: {e}")
+            self.logger.error("Network error while sending message: %s", e)
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error while sending message: {e}")
+            self.logger.error("Unexpected error while sending message: %s", e)
             return False
 
     async def schedule_rejoin(self, channel):
@@ -445,7 +557,7 @@ class DuckHuntBot:
             )
 
             self.logger.info(
-                f"Scheduling rejoin for {channel} in {retry_interval} seconds"
+                "Scheduling rejoin for %s in %s seconds", channel, retry_interval
             )
 
             # Create and store the rejoin task
@@ -454,7 +566,7 @@ class DuckHuntBot:
             )
 
         except Exception as e:
-            self.logger.error(f"Error scheduling rejoin for {channel}: {e}")
+            self.logger.error("Error scheduling rejoin for %s: %s", channel, e)
 
     async def _rejoin_channel_loop(self, channel, max_attempts, retry_interval):
         """Internal loop for attempting to rejoin a channel"""
@@ -467,13 +579,16 @@ class DuckHuntBot:
                 self.rejoin_attempts[channel] += 1
 
                 self.logger.info(
-                    f"Rejoin attempt {self.rejoin_attempts[channel]}/{max_attempts} for {channel}"
+                    "Rejoin attempt %s/%s for %s",
+                    self.rejoin_attempts[channel],
+                    max_attempts,
+                    channel,
                 )
 
                 # Check if we're still connected and registered
                 if not self.registered or not self.writer or self.writer.is_closing():
                     self.logger.warning(
-                        f"Cannot rejoin {channel}: not connected to server"
+                        "Cannot rejoin %s: not connected to server", channel
                     )
                     await asyncio.sleep(retry_interval)
                     continue
@@ -482,10 +597,10 @@ class DuckHuntBot:
                 if self.send_raw(f"JOIN {channel}"):
                     self.pending_joins[channel] = None
                     self.logger.info(
-                        f"Sent JOIN for {channel} (waiting for server confirmation)"
+                        "Sent JOIN for %s (waiting for server confirmation)", channel
                     )
                 else:
-                    self.logger.warning(f"Failed to send JOIN command for {channel}")
+                    self.logger.warning("Failed to send JOIN command for %s", channel)
 
                 # Wait before next attempt (if needed)
                 await asyncio.sleep(retry_interval)
@@ -493,10 +608,10 @@ class DuckHuntBot:
             # If we've exceeded max attempts or channel was successfully joined
             if channel in self.channels_joined:
                 self.rejoin_attempts[channel] = 0
-                self.logger.info(f"Rejoin confirmed for {channel}")
+                self.logger.info("Rejoin confirmed for %s", channel)
             elif self.rejoin_attempts[channel] >= max_attempts:
                 self.logger.error(
-                    f"Exhausted all {max_attempts} rejoin attempts for {channel}"
+                    "Exhausted all %s rejoin attempts for %s", max_attempts, channel
                 )
 
             # Clean up
@@ -504,25 +619,35 @@ class DuckHuntBot:
                 del self.rejoin_tasks[channel]
 
         except asyncio.CancelledError:
-            self.logger.debug(f"Rejoin task for {channel} was cancelled")
+            self.logger.debug("Rejoin task for %s was cancelled", channel)
         except Exception as e:
-            self.logger.error(f"Error in rejoin loop for {channel}: {e}")
+            self.logger.error("Error in rejoin loop for %s: %s", channel, e)
         finally:
             # Ensure cleanup
             if channel in self.rejoin_tasks:
                 del self.rejoin_tasks[channel]
 
-    def _track_task(self, coro):
+    def _track_task(self, coro, eager=False):
         """Schedule a fire-and-forget coroutine as a task while retaining a strong
         reference to it (in `self._background_tasks`) until it completes.
 
         Per the `asyncio.create_task` docs, an event loop only holds a *weak* reference
         to tasks - if nothing else references a task, it can be garbage-collected before
         it finishes running, silently dropping it. This wrapper prevents that.
+
+        `eager=True` (outgoing-message tasks only) starts the task inside this call on
+        Python 3.12+, so a send that finds the pacer idle writes without waiting a loop
+        iteration. Order is unaffected: the task still queues on the pacer lock in
+        creation order, and asyncio.Lock never lets a newcomer jump waiting tasks.
+        Long-lived and control tasks keep the default, lazily started tasks.
         """
-        task = asyncio.create_task(coro)
-        self._background_tasks.add(task)
-        task.add_done_callback(self._background_tasks.discard)
+        if eager and _EAGER_TASK_FACTORY is not None:
+            task = _EAGER_TASK_FACTORY(asyncio.get_running_loop(), coro)
+        else:
+            task = asyncio.create_task(coro)
+        if not task.done():  # an eager task may already have finished
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
         return task
 
     def _prune_rate_limiters(self):
@@ -536,17 +661,18 @@ class DuckHuntBot:
                 return
             by_age = sorted(
                 self._rate_limiters.items(),
-                key=lambda kv: kv[1].get("last_refill", 0),
+                key=lambda kv: kv[1][1],
             )
             evict_count = len(self._rate_limiters) - target_size
             for nick_key, _ in by_age[:evict_count]:
                 self._rate_limiters.pop(nick_key, None)
             self.logger.debug(
-                f"Pruned rate limiter state: evicted {evict_count} entries, "
-                f"{len(self._rate_limiters)} remaining"
+                "Pruned rate limiter state: evicted %d entries, %d remaining",
+                evict_count,
+                len(self._rate_limiters),
             )
         except Exception as e:
-            self.logger.error(f"Error pruning rate limiters: {e}")
+            self.logger.error("Error pruning rate limiters: %s", e)
 
     async def _paced_send_raw(self, msg) -> bool:
         """Send one raw line, enforcing a minimum gap between chat lines.
@@ -567,7 +693,7 @@ class DuckHuntBot:
         """Send message to target (channel or user) with enhanced error handling"""
         if not isinstance(target, str) or not isinstance(msg, str):
             self.logger.warning(
-                f"Invalid message parameters: target={type(target)}, msg={type(msg)}"
+                "Invalid message parameters: target=%s, msg=%s", type(target), type(msg)
             )
             return False
 
@@ -577,7 +703,31 @@ class DuckHuntBot:
                 lambda: self._send_message_impl(target, msg),
                 fallback=False,
                 logger=self.logger,
-            )
+            ),
+            eager=True,
+        )
+        return True
+
+    def send_messages(self, target, msgs):
+        """Send several messages to one target from a single background task.
+
+        Each line still goes out as its own paced PRIVMSG, in order; this only saves
+        scheduling one task per line for multi-line replies.
+        """
+        msgs = list(msgs)
+        if not isinstance(target, str) or not all(isinstance(m, str) for m in msgs):
+            self.logger.warning("Invalid message parameters: target=%s", type(target))
+            return False
+
+        async def _send_all():
+            sent = [await self._send_message_impl(target, msg) for msg in msgs]
+            return all(sent)
+
+        self._track_task(
+            self.error_recovery.safe_execute_async(
+                _send_all, fallback=False, logger=self.logger
+            ),
+            eager=True,
         )
         return True
 
@@ -593,7 +743,7 @@ class DuckHuntBot:
             safe_msg = sanitize_user_input(msg, max_length=4000)
 
             if not safe_target or not safe_msg:
-                self.logger.warning(f"Empty target or message after sanitization")
+                self.logger.warning("Empty target or message after sanitization")
                 return False
 
             # Split long messages to prevent IRC limits
@@ -633,19 +783,19 @@ class DuckHuntBot:
                     success_count += 1
                 else:
                     self.logger.error(
-                        f"Failed to send message part {i + 1}/{len(messages)}"
+                        "Failed to send message part %d/%d", i + 1, len(messages)
                     )
 
             return success_count == len(messages)
         except Exception as e:
-            self.logger.error(f"Error sanitizing/sending message: {e}")
+            self.logger.error("Error sanitizing/sending message: %s", e)
             return False
 
     def send_notice(self, target, msg):
         """Send a NOTICE to target (channel or user)"""
         if not isinstance(target, str) or not isinstance(msg, str):
             self.logger.warning(
-                f"Invalid notice parameters: target={type(target)}, msg={type(msg)}"
+                "Invalid notice parameters: target=%s, msg=%s", type(target), type(msg)
             )
             return False
         try:
@@ -661,11 +811,45 @@ class DuckHuntBot:
             # bursts (e.g. the full !shop menu) are flood-throttled too. Return
             # value now means "scheduled", matching send_message's semantics.
             self._track_task(
-                self._paced_send_raw(f"NOTICE {safe_target} :{safe_msg}")
+                self._paced_send_raw(f"NOTICE {safe_target} :{safe_msg}"), eager=True
+            )
+            return True
+        except Exception as e:
+            self.logger.error("Error sending notice to %s: %s", target, e)
+            return False
+
+    def send_notices(self, target, msgs):
+        """Send several NOTICEs to one target from a single paced background task.
+
+        Lines are not merged into one write: like send_notice, each goes through
+        _paced_send_raw so a long menu stays flood-throttled.
+        """
+        msgs = list(msgs)
+        if not isinstance(target, str) or not all(isinstance(m, str) for m in msgs):
+            self.logger.warning("Invalid notice parameters: target=%s", type(target))
+            return False
+        try:
+            safe_target = sanitize_user_input(
+                target,
+                max_length=100,
+                allowed_chars="#&+!abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-[]{}^`|\\",
             )
+            if not safe_target:
+                return False
+            lines = [
+                f"NOTICE {safe_target} :{safe_msg}"
+                for safe_msg in (sanitize_user_input(m, max_length=400) for m in msgs)
+                if safe_msg
+            ]
+
+            async def _send_all():
+                for line in lines:
+                    await self._paced_send_raw(line)
+
+            self._track_task(_send_all(), eager=True)
             return True
         except Exception as e:
-            self.logger.error(f"Error sending notice to {target}: {e}")
+            self.logger.error("Error sending notices to %s: %s", target, e)
             return False
 
     async def send_server_password(self):
@@ -681,206 +865,181 @@ class DuckHuntBot:
         """Register user with IRC server (NICK/USER commands)"""
         nick = self.get_config("connection.nick", "DuckHunt")
         self.current_nick = nick
-        self.send_raw(f"NICK {nick}")
-        self.send_raw(f"USER {nick} 0 * :{nick}")
+        self.send_raw_lines([f"NICK {nick}", f"USER {nick} 0 * :{nick}"])
 
     async def handle_message(self, prefix, command, params, trailing):
         """Handle incoming IRC messages with comprehensive error handling"""
         try:
             if not isinstance(command, str):
-                self.logger.warning(f"Invalid command type: {type(command)}")
+                self.logger.warning("Invalid command type: %s", type(command))
                 return
 
             if params is None:
                 params = []
             elif not isinstance(params, list):
-                self.logger.warning(f"Invalid params type: {type(params)}")
+                self.logger.warning("Invalid params type: %s", type(params))
                 params = []
 
             if trailing is None:
                 trailing = ""
             elif not isinstance(trailing, str):
-                self.logger.warning(f"Invalid trailing type: {type(trailing)}")
+                self.logger.warning("Invalid trailing type: %s", type(trailing))
                 trailing = str(trailing)
 
-            if command == "CAP":
-                await self.sasl_handler.handle_cap_response(params, trailing)
-                return
+            handler = self.irc_handlers.get(command)
+            if handler is not None:
+                await handler(prefix, command, params, trailing)
 
-            elif command == "AUTHENTICATE":
-                await self.sasl_handler.handle_authenticate_response(params)
-                return
+        except Exception as e:
+            self.logger.error("Critical error in handle_message: %s", e)
 
-            elif command in ["903", "904", "905", "906", "907", "908"]:
-                await self.sasl_handler.handle_sasl_result(command, params, trailing)
-                return
+    async def _on_welcome(self, prefix, command, params, trailing):
+        """001: registration finished; autojoin the configured channels."""
+        self.registered = True
+        self._nick_attempts = 0
+        # The server tells us the nick we actually registered with (it may
+        # differ from config if a 433 fallback was used).
+        if params and isinstance(params[0], str) and params[0]:
+            self.current_nick = params[0]
+        self.logger.info(
+            "Successfully registered with IRC server as %s", self.current_nick
+        )
 
-            elif command == "001":
-                self.registered = True
-                self._nick_attempts = 0
-                # The server tells us the nick we actually registered with (it may
-                # differ from config if a 433 fallback was used).
-                if params and isinstance(params[0], str) and params[0]:
-                    self.current_nick = params[0]
-                self.logger.info(
-                    f"Successfully registered with IRC server as {self.current_nick}"
+        channels = self.get_config("connection.channels", []) or []
+        joins = []
+        for channel in channels:
+            try:
+                joins.append(f"JOIN {channel}")
+                # Wait for server JOIN confirmation before marking joined.
+                if not hasattr(self, "pending_joins") or not isinstance(
+                    self.pending_joins, dict
+                ):
+                    self.pending_joins = {}
+                self.pending_joins[self._channel_key(channel)] = None
+            except Exception as e:
+                self.logger.error("Error joining channel %s: %s", channel, e)
+        # All autojoins go out in one write rather than one per channel
+        self.send_raw_lines(joins)
+
+    async def _on_nick_in_use(self, prefix, command, params, trailing):
+        """433/436: nickname in use or collided; try a fallback nick."""
+        # Nickname in use / nick collision. Without this the bot would never
+        # register (NICK is only sent once) and hang silently forever.
+        if not self.registered:
+            self._nick_attempts += 1
+            base = self.get_config("connection.nick", "DuckHunt") or "DuckHunt"
+            if self._nick_attempts > 10:
+                self.logger.error(
+                    "Nickname %r and %d fallbacks "
+                    "all in use; giving up on this connection attempt",
+                    base,
+                    self._nick_attempts - 1,
                 )
-
-                channels = self.get_config("connection.channels", []) or []
-                for channel in channels:
-                    try:
-                        self.send_raw(f"JOIN {channel}")
-                        # Wait for server JOIN confirmation before marking joined.
-                        if not hasattr(self, "pending_joins") or not isinstance(
-                            self.pending_joins, dict
-                        ):
-                            self.pending_joins = {}
-                        self.pending_joins[self._channel_key(channel)] = None
-                    except Exception as e:
-                        self.logger.error(f"Error joining channel {channel}: {e}")
-
-            elif command in {"433", "436"}:
-                # Nickname in use / nick collision. Without this the bot would never
-                # register (NICK is only sent once) and hang silently forever.
-                if not self.registered:
-                    self._nick_attempts += 1
-                    base = self.get_config("connection.nick", "DuckHunt") or "DuckHunt"
-                    if self._nick_attempts > 10:
-                        self.logger.error(
-                            f"Nickname {base!r} and {self._nick_attempts - 1} fallbacks "
-                            "all in use; giving up on this connection attempt"
-                        )
-                        return
-                    alt_nick = f"{base[:12]}{self._nick_attempts}"
-                    self.logger.warning(
-                        f"Nickname in use ({command}); trying fallback nick {alt_nick!r}"
-                    )
-                    self.current_nick = alt_nick
-                    self.send_raw(f"NICK {alt_nick}")
                 return
+            alt_nick = f"{base[:12]}{self._nick_attempts}"
+            self.logger.warning(
+                "Nickname in use (%s); trying fallback nick %r", command, alt_nick
+            )
+            self.current_nick = alt_nick
+            self.send_raw(f"NICK {alt_nick}")
+
+    async def _on_join_failed(self, prefix, command, params, trailing):
+        """Numeric JOIN failures (banned, full, invite-only, ...)."""
+        # Common formats:
+        # 471 <me> <#chan> :Cannot join channel (+l)
+        # 474 <me> <#chan> :Cannot join channel (+b)
+        # 477 <me> <#chan> :You need to be identified...
+        our_nick = self.current_nick
+        if params and len(params) >= 2 and params[0].lower() == our_nick.lower():
+            failed_channel = params[1]
+            reason = trailing or "Join rejected"
+            failed_key = self._channel_key(failed_channel)
+            self.channels_joined.discard(failed_key)
+            if hasattr(self, "pending_joins") and isinstance(self.pending_joins, dict):
+                self.pending_joins.pop(failed_key, None)
+            self.logger.warning(
+                "Failed to join %s: (%s) %s", failed_channel, command, reason
+            )
 
-            # JOIN failures (numeric replies)
-            elif command in {
-                "403",
-                "405",
-                "437",
-                "471",
-                "473",
-                "474",
-                "475",
-                "477",
-                "438",
-                "439",
-            }:
-                # Common formats:
-                # 471 <me> <#chan> :Cannot join channel (+l)
-                # 474 <me> <#chan> :Cannot join channel (+b)
-                # 477 <me> <#chan> :You need to be identified...
-                our_nick = self.current_nick
-                if (
-                    params
-                    and len(params) >= 2
-                    and params[0].lower() == our_nick.lower()
-                ):
-                    failed_channel = params[1]
-                    reason = trailing or "Join rejected"
-                    failed_key = self._channel_key(failed_channel)
-                    self.channels_joined.discard(failed_key)
-                    if hasattr(self, "pending_joins") and isinstance(
-                        self.pending_joins, dict
-                    ):
-                        self.pending_joins.pop(failed_key, None)
-                    self.logger.warning(
-                        f"Failed to join {failed_channel}: ({command}) {reason}"
-                    )
+    async def _on_join(self, prefix, command, params, trailing):
+        """JOIN: track our own joins and rejoins."""
+        if prefix:
+            # Some servers send either:
+            #   :nick!user@host JOIN #chan
+            # or
+            #   :nick!user@host JOIN :#chan
+            channel = None
+            if len(params) >= 1:
+                channel = params[0]
+            elif trailing and isinstance(trailing, str) and trailing.startswith("#"):
+                channel = trailing
+
+            if not channel:
                 return
 
-            elif command == "JOIN":
-                if prefix:
-                    # Some servers send either:
-                    #   :nick!user@host JOIN #chan
-                    # or
-                    #   :nick!user@host JOIN :#chan
-                    channel = None
-                    if len(params) >= 1:
-                        channel = params[0]
-                    elif (
-                        trailing
-                        and isinstance(trailing, str)
-                        and trailing.startswith("#")
-                    ):
-                        channel = trailing
-
-                    if not channel:
-                        return
-
-                    safe_channel = sanitize_user_input(
-                        channel,
-                        max_length=100,
-                        allowed_chars="#&+!abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-[]{}^`|\\",
-                    )
-                    channel_key = self._channel_key(safe_channel)
-                    joiner_nick = prefix.split("!")[0] if "!" in prefix else prefix
-                    our_nick = self.current_nick
-
-                    # Check if we successfully joined (or rejoined) a channel
-                    if joiner_nick and joiner_nick.lower() == our_nick.lower():
-                        self.channels_joined.add(channel_key)
-                        self.logger.info(f"Successfully joined channel {channel}")
-
-                        # Clear pending join marker
-                        if hasattr(self, "pending_joins") and isinstance(
-                            self.pending_joins, dict
-                        ):
-                            self.pending_joins.pop(channel_key, None)
-
-                        # Cancel any pending rejoin attempts for this channel
-                        if channel_key in self.rejoin_tasks:
-                            self.rejoin_tasks[channel_key].cancel()
-                            del self.rejoin_tasks[channel_key]
-
-                        # Reset rejoin attempts counter
-                        if channel_key in self.rejoin_attempts:
-                            self.rejoin_attempts[channel_key] = 0
-
-            elif command == "PRIVMSG":
-                if len(params) >= 1:
-                    target = params[0]
-                    message = trailing or ""
-                    await self.handle_command(prefix, target, message)
-
-            elif command == "KICK":
-                if len(params) >= 2:
-                    channel = params[0]
-                    kicked_nick = params[1]
-                    kicker = (
-                        prefix.split("!")[0] if prefix and "!" in prefix else prefix
-                    )
-                    reason = trailing or "No reason given"
-
-                    # Check if we were the one kicked
-                    our_nick = self.current_nick
-                    if kicked_nick and kicked_nick.lower() == our_nick.lower():
-                        self.logger.warning(
-                            f"Kicked from {channel} by {kicker}: {reason}"
-                        )
-
-                        # Remove from joined channels
-                        channel_key = self._channel_key(channel)
-                        self.channels_joined.discard(channel_key)
-
-                        # Schedule rejoin if auto-rejoin is enabled
-                        if self.get_config("connection.auto_rejoin.enabled", True):
-                            self._track_task(self.schedule_rejoin(channel_key))
-
-            elif command == "PING":
-                try:
-                    self.send_raw(f"PONG :{trailing}")
-                except Exception as e:
-                    self.logger.error(f"Error responding to PING: {e}")
-
+            safe_channel = sanitize_user_input(
+                channel,
+                max_length=100,
+                allowed_chars="#&+!abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-[]{}^`|\\",
+            )
+            channel_key = self._channel_key(safe_channel)
+            joiner_nick = prefix.split("!")[0] if "!" in prefix else prefix
+            our_nick = self.current_nick
+
+            # Check if we successfully joined (or rejoined) a channel
+            if joiner_nick and joiner_nick.lower() == our_nick.lower():
+                self.channels_joined.add(channel_key)
+                self.logger.info("Successfully joined channel %s", channel)
+
+                # Clear pending join marker
+                if hasattr(self, "pending_joins") and isinstance(
+                    self.pending_joins, dict
+                ):
+                    self.pending_joins.pop(channel_key, None)
+
+                # Cancel any pending rejoin attempts for this channel
+                if channel_key in self.rejoin_tasks:
+                    self.rejoin_tasks[channel_key].cancel()
+                    del self.rejoin_tasks[channel_key]
+
+                # Reset rejoin attempts counter
+                if channel_key in self.rejoin_attempts:
+                    self.rejoin_attempts[channel_key] = 0
+
+    async def _on_privmsg(self, prefix, command, params, trailing):
+        """PRIVMSG: pass channel and private messages to handle_command."""
+        if len(params) >= 1:
+            target = params[0]
+            message = trailing or ""
+            await self.handle_command(prefix, target, message)
+
+    async def _on_kick(self, prefix, command, params, trailing):
+        """KICK: drop the channel and schedule a rejoin if we were kicked."""
+        if len(params) >= 2:
+            channel = params[0]
+            kicked_nick = params[1]
+            kicker = prefix.split("!")[0] if prefix and "!" in prefix else prefix
+            reason = trailing or "No reason given"
+
+            # Check if we were the one kicked
+            our_nick = self.current_nick
+            if kicked_nick and kicked_nick.lower() == our_nick.lower():
+                self.logger.warning("Kicked from %s by %s: %s", channel, kicker, reason)
+
+                # Remove from joined channels
+                channel_key = self._channel_key(channel)
+                self.channels_joined.discard(channel_key)
+
+                # Schedule rejoin if auto-rejoin is enabled
+                if self.get_config("connection.auto_rejoin.enabled", True):
+                    self._track_task(self.schedule_rejoin(channel_key))
+
+    async def _on_ping(self, prefix, command, params, trailing):
+        """PING: answer with PONG."""
+        try:
+            self.send_raw(f"PONG :{trailing}")
         except Exception as e:
-            self.logger.error(f"Critical error in handle_message: {e}")
+            self.logger.error("Error responding to PING: %s", e)
 
     async def handle_command(self, user, channel, message):
         """Handle bot commands with enhanced error handling and input validation"""
@@ -893,38 +1052,28 @@ class DuckHuntBot:
 
             if not isinstance(user, str) or not isinstance(channel, str):
                 self.logger.warning(
-                    f"Invalid user/channel types: {type(user)}, {type(channel)}"
+                    "Invalid user/channel types: %s, %s", type(user), type(channel)
                 )
                 return
 
             # Sanitize inputs
             safe_message = sanitize_user_input(message, max_length=500)
-            # Include @, ., * so hostmask-based admin auth (nick!user@host.domain) works correctly.
-            safe_user = sanitize_user_input(
-                user,
-                max_length=200,
-                allowed_chars="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-[]{}^`|\\!@.*:",
-            )
-            safe_channel = sanitize_user_input(
-                channel,
-                max_length=100,
-                allowed_chars="#&+!abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-[]{}^`|\\",
-            )
 
             if not safe_message.startswith(self.command_prefix):
                 return
 
+            # Only the command word is split off up front; the rest of the line is
+            # tokenized once the command is known to exist.
             try:
-                parts = safe_message[len(self.command_prefix) :].split()
+                parts = safe_message[len(self.command_prefix) :].split(None, 1)
             except Exception as e:
-                self.logger.warning(f"Error parsing command '{message}': {e}")
+                self.logger.warning("Error parsing command '%s': %s", message, e)
                 return
 
             if not parts:
                 return
 
             cmd = parts[0].lower()
-            args = parts[1:] if len(parts) > 1 else []
 
             # Unknown commands are dropped BEFORE any database access, so random
             # "!whatever" spam from arbitrary nicks can no longer create persistent
@@ -932,10 +1081,24 @@ class DuckHuntBot:
             # same way (matching the previous silent-ignore behavior).
             entry = self.command_handlers.get(cmd)
             if entry is None:
-                self.logger.debug(f"Unknown command '{cmd}' ignored")
+                self.logger.debug("Unknown command '%s' ignored", cmd)
                 return
+
+            args = parts[1].split() if len(parts) > 1 else []
+            # Include @, ., * so hostmask-based admin auth (nick!user@host.domain) works correctly.
+            safe_user = sanitize_user_input(
+                user,
+                max_length=200,
+                allowed_chars="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-[]{}^`|\\!@.*:",
+            )
+            safe_channel = sanitize_user_input(
+                channel,
+                max_length=100,
+                allowed_chars="#&+!abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-[]{}^`|\\",
+            )
+
             if entry[0] and not self.is_admin(safe_user):
-                self.logger.debug(f"Non-admin attempted admin command '{cmd}'")
+                self.logger.debug("Non-admin attempted admin command '%s'", cmd)
                 return
 
             # Extract and validate nick with enhanced error handling
@@ -947,7 +1110,7 @@ class DuckHuntBot:
 
             if not nick or nick == "Unknown":
                 self.logger.warning(
-                    f"Could not extract valid nick from user string: {user}"
+                    "Could not extract valid nick from user string: %s", user
                 )
                 return
 
@@ -966,7 +1129,7 @@ class DuckHuntBot:
                 ):
                     return
             except Exception as e:
-                self.logger.error(f"Error checking admin/ignore status: {e}")
+                self.logger.error("Error checking admin/ignore status: %s", e)
                 return
 
             # Get player data with error recovery
@@ -989,25 +1152,34 @@ class DuckHuntBot:
                     "gun_confiscated": False,
                 }
 
+            # One clock read per command, shared with the rate limiter
+            now = time.time()
+
             # Update activity tracking safely
             if safe_channel.startswith("#"):
                 try:
                     player["last_activity_channel"] = safe_channel
-                    player["last_activity_time"] = time.time()
+                    player["last_activity_time"] = now
                 except Exception as e:
                     self.logger.warning(
-                        f"Error updating player activity for {nick}: {e}"
+                        "Error updating player activity for %s: %s", nick, e
                     )
 
             await self._execute_command_safely(
-                cmd, nick, safe_channel, player, args, safe_user
+                cmd, nick, safe_channel, player, args, safe_user, now=now
             )
 
         except Exception as e:
-            self.logger.error(f"Critical error in handle_command: {e}")
+            self.logger.error("Critical error in handle_command: %s", e)
 
-    async def _execute_command_safely(self, cmd, nick, channel, player, args, user):
-        """Execute a command via the dispatch table with error isolation."""
+    async def _execute_command_safely(
+        self, cmd, nick, channel, player, args, user, now=None
+    ):
+        """Execute a command via the dispatch table with error isolation.
+
+        `now` is the time.time() read taken when the command arrived; it is read
+        here if the caller did not pass one.
+        """
         try:
             # Sanitize command arguments
             safe_args = []
@@ -1016,16 +1188,14 @@ class DuckHuntBot:
                 if safe_arg:
                     safe_args.append(safe_arg)
 
-            # Rate-limited command set
-            limited_cmds = {"bang", "bef", "befriend", "shop", "use"}
-
             # Check rate limiter for these commands
-            if cmd in limited_cmds:
+            if cmd in RATE_LIMITED_COMMANDS:
                 nick_key = nick.lower()
-                now = time.time()
+                if now is None:
+                    now = time.time()
                 rl = self._rate_limiters.get(nick_key)
                 if rl is None:
-                    rl = {"tokens": self._rl_capacity, "last_refill": now}
+                    rl = [self._rl_capacity, now]
                     self._rate_limiters[nick_key] = rl
                     # Opportunistically bound memory growth: only checked when adding a
                     # new entry (cheap), so a flood of one-off/spoofed nicks can't grow
@@ -1034,13 +1204,13 @@ class DuckHuntBot:
                         self._prune_rate_limiters()
 
                 # Refill tokens
-                since = now - rl["last_refill"]
+                since = now - rl[1]
                 if since > 0:
                     refill = since / self._rl_refill_secs
-                    rl["tokens"] = min(self._rl_capacity, rl["tokens"] + refill)
-                    rl["last_refill"] = now
+                    rl[0] = min(self._rl_capacity, rl[0] + refill)
+                    rl[1] = now
 
-                if rl["tokens"] < 1.0:
+                if rl[0] < 1.0:
                     # Deny execution and notify user
                     try:
                         msg = self.messages.get("rate_limited", nick=nick)
@@ -1052,7 +1222,7 @@ class DuckHuntBot:
                         )
                     return
                 else:
-                    rl["tokens"] -= 1.0
+                    rl[0] -= 1.0
 
             # Special case: admin PM-only bot restart uses !reload.
             # In channels, !reload remains the gameplay reload command.
@@ -1066,7 +1236,7 @@ class DuckHuntBot:
 
             entry = self.command_handlers.get(cmd)
             if entry is None:
-                self.logger.debug(f"Unknown command '{cmd}' from {nick}")
+                self.logger.debug("Unknown command '%s' from %s", cmd, nick)
                 return
             admin_only, handler = entry
             if admin_only and not self.is_admin(user):
@@ -1080,7 +1250,7 @@ class DuckHuntBot:
 
         except Exception as e:
             self.logger.error(
-                f"Critical error executing command '{cmd}' for user {nick}: {e}"
+                "Critical error executing command '%s' for user %s: %s", cmd, nick, e
             )
 
             # Provide user-friendly error message
@@ -1094,7 +1264,7 @@ class DuckHuntBot:
                 else:
                     self.logger.debug("Skipping error message for private channel")
             except Exception as send_error:
-                self.logger.error(f"Error sending user error message: {send_error}")
+                self.logger.error("Error sending user error message: %s", send_error)
 
     def validate_target_player(self, target_nick, channel):
         """
@@ -1201,10 +1371,7 @@ class DuckHuntBot:
                     return
                 except (ValueError, IndexError):
                     # Show available items so the player knows which ID to use
-                    items_list = " | ".join(
-                        f"({iid}) {it['name']} {it['price']}XP"
-                        for iid, it in sorted(self.shop.get_items().items())
-                    )
+                    items_list = self.shop.menu_summary()
                     self.send_message(
                         channel,
                         f"{nick} > Usage: {self.command_prefix}shop buy <id>. Items: {items_list}",
@@ -1213,13 +1380,14 @@ class DuckHuntBot:
 
         # Send full shop menu via NOTICE to the user
         xp = player.get("xp", 0)
-        self.send_notice(nick, f"=== DuckHunt Shop === (You have {xp} XP)")
-        for item_id, item in sorted(self.shop.get_items().items()):
-            self.send_notice(
-                nick,
-                f"  ({item_id}) {item['name']} - {item['price']} XP — {item.get('description', '')}",
-            )
-        self.send_notice(nick, f"Use: {self.command_prefix}shop buy <id> [target]")
+        self.send_notices(
+            nick,
+            [
+                f"=== DuckHunt Shop === (You have {xp} XP)",
+                *self.shop.menu_lines(),
+                f"Use: {self.command_prefix}shop buy <id> [target]",
+            ],
+        )
         if channel.startswith("#"):
             self.send_message(
                 channel, f"{nick} > Check your notices for the shop menu."
@@ -1296,7 +1464,7 @@ class DuckHuntBot:
                 f"[Achievement] {nick} unlocked: {ach['name']} - {ach['description']}",
             )
 
-        self.db.save_database()
+        self.db.request_save()
 
     async def handle_duckstats(self, nick, channel, player, args=None):
         """Handle !duckstats command"""
@@ -1314,11 +1482,7 @@ class DuckHuntBot:
             display_player = player
         # Safely extract only the control byte from colour mappings so numeric
         # colour parameters don't accidentally consume adjacent digits (e.g. XP values).
-        colours_map = (
-            self.messages.messages.get("colours", {})
-            if isinstance(self.messages.messages.get("colours", {}), dict)
-            else {}
-        )
+        colours_map = self.messages.colours
 
         def _ctrl(c):
             return c[0] if isinstance(c, str) and c else ""
@@ -1367,16 +1531,21 @@ class DuckHuntBot:
         # - inv_mags: Magazine items sitting in inventory (these are consumed on !reload when slots run out)
         # Show them separately so the number matches what !inv shows
         active_spares = max(0, display_player.get("magazines", 1) - 1)
+        # One pass over the inventory collects both the magazine count and
+        # the item names shown at the end of the line.
         inv_mags = 0
+        items = []
         inventory = display_player.get("inventory", {})
         for item_id_str, qty in inventory.items():
-            if qty > 0:
-                try:
-                    item = self.shop.get_item(int(item_id_str))
-                    if item and item.get("type") == "magazine":
-                        inv_mags += qty
-                except ValueError:
-                    pass
+            try:
+                item = self.shop.get_item(int(item_id_str))
+            except ValueError:
+                continue
+            if not item:
+                continue
+            items.append(f"{item['name']} x{qty}")
+            if qty > 0 and item.get("type") == "magazine":
+                inv_mags += qty
         # Total reloads available = active level-slots + inventory Magazine items
         total_spares = active_spares + inv_mags
 
@@ -1404,15 +1573,8 @@ class DuckHuntBot:
         ]
 
         # Add inventory if player has items
-        inventory = display_player.get("inventory", {})
-        if inventory:
-            items = []
-            for item_id, quantity in inventory.items():
-                item = self.shop.get_item(int(item_id))
-                if item:
-                    items.append(f"{item['name']} x{quantity}")
-            if items:
-                stats_parts.append(f"Items: {', '.join(items)}")
+        if items:
+            stats_parts.append(f"Items: {', '.join(items)}")
 
         # Add temporary effects if any
         temp_effects = display_player.get("temporary_effects", [])
@@ -1433,8 +1595,9 @@ class DuckHuntBot:
         """Handle !topduck command - show leaderboards"""
         try:
             # Apply color formatting
-            bold = self.messages.messages.get("colours", {}).get("bold", "")
-            reset = self.messages.messages.get("colours", {}).get("reset", "")
+            colours = self.messages.colours
+            bold = colours.get("bold", "")
+            reset = colours.get("reset", "")
 
             # Get top 5 by XP
             top_xp = self.db.get_leaderboard(channel, "xp", 5)
@@ -1479,14 +1642,15 @@ class DuckHuntBot:
                 self.send_message(channel, "No befriending data available yet!")
 
         except Exception as e:
-            self.logger.error(f"Error in handle_topduck: {e}")
+            self.logger.error("Error in handle_topduck: %s", e)
             self.send_message(channel, f"{nick} > Error retrieving leaderboard data.")
 
     async def handle_globaltop(self, nick, channel):
         """Handle !globaltop command - show top players across all channels (by XP)."""
         try:
-            bold = self.messages.messages.get("colours", {}).get("bold", "")
-            reset = self.messages.messages.get("colours", {}).get("reset", "")
+            colours = self.messages.colours
+            bold = colours.get("bold", "")
+            reset = colours.get("reset", "")
 
             def _display_channel_key(channel_key: str) -> str:
                 """Convert internal channel keys to a user-friendly label."""
@@ -1518,8 +1682,7 @@ class DuckHuntBot:
                 self.send_message(channel, f"{nick} > No global XP data available yet!")
                 return
 
-            entries.sort(key=lambda t: t[0], reverse=True)
-            top5 = entries[:5]
+            top5 = heapq.nlargest(5, entries, key=lambda t: t[0])
 
             parts = []
             medals = {1: "#1", 2: "#2", 3: "#3"}
@@ -1531,7 +1694,7 @@ class DuckHuntBot:
             line = f"{bold}Top XP:{reset} " + " | ".join(parts)
             self.send_message(channel, line)
         except Exception as e:
-            self.logger.error(f"Error in handle_globaltop: {e}")
+            self.logger.error("Error in handle_globaltop: %s", e)
             self.send_message(
                 channel, f"{nick} > Error retrieving global leaderboard data."
             )
@@ -1626,8 +1789,6 @@ class DuckHuntBot:
 
     async def handle_daily(self, nick, channel, player):
         """Handle !daily — claim a daily XP bonus once per 24 hours."""
-        import random as _random
-
         now = time.time()
         last_daily = player.get("last_daily", 0)
         if now - last_daily < 86400:
@@ -1640,11 +1801,10 @@ class DuckHuntBot:
             return
 
         # Track daily streak
-        import datetime as _dt
-
-        today = _dt.date.today().isoformat()
+        today_date = datetime.date.today()
+        today = today_date.isoformat()
         last_date = player.get("last_daily_date", "")
-        yesterday = (_dt.date.today() - _dt.timedelta(days=1)).isoformat()
+        yesterday = (today_date - datetime.timedelta(days=1)).isoformat()
         if last_date == yesterday:
             player["daily_streak"] = player.get("daily_streak", 0) + 1
         elif last_date != today:
@@ -1653,7 +1813,7 @@ class DuckHuntBot:
         player["last_daily"] = now
 
         daily_streak = player.get("daily_streak", 1)
-        xp_bonus = _random.randint(10, 25) + (daily_streak - 1) * 2  # Streak bonus
+        xp_bonus = random.randint(10, 25) + (daily_streak - 1) * 2  # Streak bonus
         player["xp"] = player.get("xp", 0) + xp_bonus
 
         streak_msg = (
@@ -1674,7 +1834,7 @@ class DuckHuntBot:
                 channel,
                 f"[Achievement] {nick} unlocked: {ach['name']} - {ach['description']}",
             )
-        self.db.save_database()
+        self.db.request_save()
 
     async def handle_effects(self, nick, channel, player):
         """Handle !effects — show active temporary effects with remaining time."""
@@ -1805,8 +1965,7 @@ class DuckHuntBot:
         if active_fx:
             fx_names = [e.get("name", e.get("type", "?")) for e in active_fx]
             lines.append(f"  Effects : {' | '.join(fx_names)}")
-        for line in lines:
-            self.send_message(nick, line)
+        self.send_messages(nick, lines)
         if channel.startswith("#"):
             self.send_message(channel, f"{nick} > Profile sent to your PM!")
 
@@ -1957,7 +2116,7 @@ class DuckHuntBot:
                         f"[Achievement] {nick} unlocked: {ach['name']} - {ach['description']}",
                     )
 
-            self.db.save_database()
+            self.db.request_save()
 
         except ValueError:
             message = f"{nick} > Invalid item ID. Use {self.command_prefix}duckstats to see your items."
@@ -1989,7 +2148,9 @@ class DuckHuntBot:
 
             # Check if player has the item in inventory
             inventory = player.get("inventory", {})
-            if str(item_id) not in inventory or inventory[str(item_id)] <= 0:
+            item_key = str(item_id)
+            count = inventory.get(item_key, 0)
+            if count <= 0:
                 self.send_message(
                     channel,
                     f"{nick} > You don't have that item. Use {self.command_prefix}duckstats to check your inventory.",
@@ -2015,7 +2176,7 @@ class DuckHuntBot:
                     f"{nick} > {target_nick}'s inventory is full (max {max_total} items).",
                 )
                 return
-            if target_inventory.get(str(item_id), 0) >= max_per_item:
+            if target_inventory.get(item_key, 0) >= max_per_item:
                 self.send_message(
                     channel,
                     f"{nick} > {target_nick} already has the maximum of {max_per_item} {item['name']}s.",
@@ -2023,12 +2184,13 @@ class DuckHuntBot:
                 return
 
             # Remove from giver's inventory
-            inventory[str(item_id)] -= 1
-            if inventory[str(item_id)] <= 0:
-                del inventory[str(item_id)]
+            if count > 1:
+                inventory[item_key] = count - 1
+            else:
+                del inventory[item_key]
 
             # Add to receiver's inventory
-            target_inventory[str(item_id)] = target_inventory.get(str(item_id), 0) + 1
+            target_inventory[item_key] = target_inventory.get(item_key, 0) + 1
             target_player["inventory"] = target_inventory
 
             # Send appropriate gift message based on item type
@@ -2065,7 +2227,7 @@ class DuckHuntBot:
                 message = f"{nick} > Gave {item['name']} to {target_nick}!"
 
             self.send_message(channel, message)
-            self.db.save_database()
+            self.db.request_save()
 
         except ValueError:
             self.send_message(
@@ -2096,7 +2258,7 @@ class DuckHuntBot:
 
             message = self.messages.get("admin_rearm_self", admin=nick)
             self.send_message(reply_target, message)
-            self.db.save_database()
+            self.db.request_save()
             return
 
         # Determine the target nick/channel. In a channel, the invoking channel is
@@ -2143,7 +2305,7 @@ class DuckHuntBot:
             else:
                 message = self.messages.get("admin_rearm_all", admin=nick)
             self.send_message(reply_target, message)
-            self.db.save_database()
+            self.db.request_save()
             return
 
         # Validate the target channel when invoked via PM
@@ -2180,7 +2342,7 @@ class DuckHuntBot:
                 "admin_rearm_player", target=target_nick, admin=nick
             )
         self.send_message(reply_target, message)
-        self.db.save_database()
+        self.db.request_save()
 
     async def handle_disarm(self, nick, channel, args):
         """Handle !disarm command (admin only) - supports private messages"""
@@ -2244,7 +2406,7 @@ class DuckHuntBot:
             message = self.messages.get("admin_disarm", target=target_nick, admin=nick)
 
         self.send_message(reply_target, message)
-        self.db.save_database()
+        self.db.request_save()
 
     def _send_admin_usage_or_execute(
         self,
@@ -2290,7 +2452,7 @@ class DuckHuntBot:
             message = self.messages.get(message_key, target=target, admin=nick)
 
         self.send_message(reply_target, message)
-        self.db.save_database()
+        self.db.request_save()
 
     async def handle_ignore(self, nick, channel, args):
         """Handle !ignore command (admin only) - supports private messages"""
@@ -2366,16 +2528,12 @@ class DuckHuntBot:
             return
 
         # Force spawn the specified duck type
-        import random
-        import time
 
         if target_channel_key not in self.game.ducks:
             self.game.ducks[target_channel_key] = []
 
         current_time = time.time()
-        duck_id = (
-            f"{duck_type_arg}_duck_{int(current_time)}_{random.randint(1000, 9999)}"
-        )
+        duck_id = self.game.new_duck_id()
 
         if duck_type_arg == "flock":
             self._track_task(
@@ -2475,7 +2633,7 @@ class DuckHuntBot:
                 self.pending_joins = {}
             self.pending_joins[target_channel_key] = None
             self.send_message(reply_target, f"{nick} > Joining {target_channel}...")
-            self.logger.info(f"Admin {nick} requested bot join {target_channel}")
+            self.logger.info("Admin %s requested bot join %s", nick, target_channel)
         else:
             self.send_message(
                 reply_target, f"{nick} > Failed to send JOIN for {target_channel}"
@@ -2513,7 +2671,7 @@ class DuckHuntBot:
         if self.send_raw(f"PART {target_channel_key}"):
             self.channels_joined.discard(target_channel_key)
             self.send_message(reply_target, f"{nick} > Left {target_channel}")
-            self.logger.info(f"Admin {nick} made bot leave {target_channel}")
+            self.logger.info("Admin %s made bot leave %s", nick, target_channel)
         else:
             self.send_message(
                 reply_target, f"{nick} > Failed to leave {target_channel}"
@@ -2533,8 +2691,9 @@ class DuckHuntBot:
             if self._lag_ping_sent is not None:
                 if now - self._lag_ping_sent > ping_timeout:
                     self.logger.error(
-                        f"No server response to keepalive PING within {ping_timeout:.0f}s; "
-                        "treating connection as dead"
+                        "No server response to keepalive PING within %.0fs; "
+                        "treating connection as dead",
+                        ping_timeout,
                     )
                     return True
             elif now - self._last_activity > ping_interval:
@@ -2542,7 +2701,7 @@ class DuckHuntBot:
                 self.send_raw("PING :duckhunt-keepalive")
                 self._lag_ping_sent = now
         except Exception as e:
-            self.logger.error(f"Error in lag watchdog: {e}")
+            self.logger.error("Error in lag watchdog: %s", e)
         return False
 
     async def _health_check_loop(self):
@@ -2564,10 +2723,10 @@ class DuckHuntBot:
                     ]
                     if unhealthy:
                         self.logger.debug(
-                            f"Unhealthy checks: {', '.join(unhealthy)}"
+                            "Unhealthy checks: %s", ', '.join(unhealthy)
                         )
                 except Exception as e:
-                    self.logger.error(f"Error running health checks: {e}")
+                    self.logger.error("Error running health checks: %s", e)
         except asyncio.CancelledError:
             pass
 
@@ -2599,7 +2758,7 @@ class DuckHuntBot:
                     self.logger.error("Connection reset by peer")
                     break
                 except OSError as e:
-                    self.logger.error(f"Network error during read: {e}")
+                    self.logger.error("Network error during read: %s", e)
                     consecutive_errors += 1
                     if consecutive_errors >= max_consecutive_errors:
                         self.logger.error(
@@ -2609,7 +2768,7 @@ class DuckHuntBot:
                     await asyncio.sleep(1)  # Brief delay before retry
                     continue
                 except Exception as e:
-                    self.logger.error(f"Unexpected error reading from stream: {e}")
+                    self.logger.error("Unexpected error reading from stream: %s", e)
                     consecutive_errors += 1
                     if consecutive_errors >= max_consecutive_errors:
                         self.logger.error(
@@ -2623,14 +2782,20 @@ class DuckHuntBot:
                     self.logger.info("Connection closed by server")
                     break
 
+                # Keepalive PINGs are answered straight from the raw bytes, without
+                # decoding or parsing the line
+                if line.startswith(b"PING "):
+                    self._write_raw(b"PONG " + line[5:].strip() + b"\r\n")
+                    continue
+
                 # Safely decode with comprehensive error handling
                 try:
                     line = line.decode("utf-8", errors="replace").strip()
                 except (UnicodeDecodeError, AttributeError) as e:
-                    self.logger.warning(f"Failed to decode message: {e}")
+                    self.logger.warning("Failed to decode message: %s", e)
                     continue
                 except Exception as e:
-                    self.logger.error(f"Unexpected error decoding message: {e}")
+                    self.logger.error("Unexpected error decoding message: %s", e)
                     continue
 
                 if not line:
@@ -2642,18 +2807,18 @@ class DuckHuntBot:
                     await self.handle_message(prefix, command, params, trailing)
                 except ValueError as e:
                     self.logger.warning(
-                        f"Malformed IRC message ignored: {line[:100]}... Error: {e}"
+                        "Malformed IRC message ignored: %s... Error: %s", line[:100], e
                     )
                 except Exception as e:
                     self.logger.error(
-                        f"Error processing message '{line[:100]}...': {e}"
+                        "Error processing message '%s...': %s", line[:100], e
                     )
                     # Continue processing other messages even if one fails
 
         except asyncio.CancelledError:
             self.logger.info("Message loop cancelled")
         except Exception as e:
-            self.logger.error(f"Critical message loop error: {e}")
+            self.logger.error("Critical message loop error: %s", e)
         finally:
             self.logger.info("Message loop ended")
 
@@ -2669,12 +2834,15 @@ class DuckHuntBot:
         game_task = None
         message_task = None
         health_task = None
+        saver_task = None
 
         try:
             # Game loops and health monitoring run for the life of the process,
             # across reconnects (spawn tasks self-pause while no channels are joined).
             game_task = asyncio.create_task(self.game.start_game_loops())
             health_task = asyncio.create_task(self._health_check_loop())
+            # Coalesces the db.request_save() calls made by game actions
+            saver_task = asyncio.create_task(self.db.saver_loop())
 
             reconnect_enabled = bool(
                 self.get_config("connection.reconnect.enabled", True)
@@ -2691,11 +2859,11 @@ class DuckHuntBot:
                 try:
                     await self.connect()
                 except (ConnectionError, OSError) as e:
-                    self.logger.error(f"Connection failed: {e}")
+                    self.logger.error("Connection failed: %s", e)
                     if not reconnect_enabled or self.shutdown_requested:
                         break
                     self.logger.info(
-                        f"Retrying connection in {reconnect_delay:.0f}s..."
+                        "Retrying connection in %.0fs...", reconnect_delay
                     )
                     await asyncio.sleep(reconnect_delay)
                     reconnect_delay = min(reconnect_delay * 2, max_delay)
@@ -2765,14 +2933,14 @@ class DuckHuntBot:
                 try:
                     self.db.save_database()
                 except Exception as e:
-                    self.logger.error(f"Error saving database before reconnect: {e}")
+                    self.logger.error("Error saving database before reconnect: %s", e)
 
                 if not reconnect_enabled:
                     self.logger.info("Connection lost and reconnect is disabled")
                     break
 
                 self.logger.warning(
-                    f"Connection lost; reconnecting in {reconnect_delay:.0f}s..."
+                    "Connection lost; reconnecting in %.0fs...", reconnect_delay
                 )
                 await asyncio.sleep(reconnect_delay)
                 reconnect_delay = min(reconnect_delay * 2, max_delay)
@@ -2782,12 +2950,12 @@ class DuckHuntBot:
         except asyncio.CancelledError:
             self.logger.info("Main loop cancelled")
         except Exception as e:
-            self.logger.error(f"Bot error: {e}")
+            self.logger.error("Bot error: %s", e)
         finally:
             # Fast cleanup - cancel tasks immediately with short timeout
             tasks_to_cancel = [
                 task
-                for task in [game_task, message_task, health_task]
+                for task in [game_task, message_task, health_task, saver_task]
                 if task and not task.done()
             ]
 
@@ -2796,7 +2964,7 @@ class DuckHuntBot:
                 if task and not task.done():
                     task.cancel()
                     tasks_to_cancel.append(task)
-                    self.logger.debug(f"Cancelled rejoin task for {channel}")
+                    self.logger.debug("Cancelled rejoin task for %s", channel)
 
             for task in tasks_to_cancel:
                 task.cancel()
@@ -2813,13 +2981,15 @@ class DuckHuntBot:
 
             # Final database save. flush_pending_saves() blocks until the
             # background write actually completes, so a later os.execv restart or
-            # process exit can never kill the write mid-flight and lose data.
+            # process exit can never kill the write mid-flight and lose data. The
+            # wait runs in a worker thread so queued replies (e.g. "Restarting bot
+            # now...") keep flowing to the still-open connection meanwhile.
             try:
                 self.db.save_database()
-                self.db.flush_pending_saves(timeout=10.0)
+                await asyncio.to_thread(self.db.flush_pending_saves, 10.0)
                 self.logger.info("Database saved")
             except Exception as e:
-                self.logger.error(f"Error saving database: {e}")
+                self.logger.error("Error saving database: %s", e)
 
             # Fast connection close
             await self._close_connection()
@@ -2829,6 +2999,8 @@ class DuckHuntBot:
             # If restart was requested (admin command), re-exec the process.
             if self.restart_requested:
                 self.logger.warning("Restart requested; re-executing process...")
+                # execv skips atexit, so write out the queued log records first
+                stop_file_listeners()
                 os.execv(sys.executable, [sys.executable] + sys.argv)
 
     async def _close_connection(self):
@@ -2846,7 +3018,7 @@ class DuckHuntBot:
                     if self.send_raw(f"QUIT :{quit_message}"):
                         await asyncio.sleep(0.2)  # Brief wait for message to send
                 except Exception as e:
-                    self.logger.debug(f"Error sending quit message: {e}")
+                    self.logger.debug("Error sending quit message: %s", e)
 
                 # Close the writer
                 try:
@@ -2855,12 +3027,12 @@ class DuckHuntBot:
                 except asyncio.TimeoutError:
                     self.logger.warning("Connection close timed out - forcing close")
                 except Exception as e:
-                    self.logger.debug(f"Error during connection close: {e}")
+                    self.logger.debug("Error during connection close: %s", e)
 
             self.logger.info("IRC connection closed")
 
         except Exception as e:
-            self.logger.error(f"Critical error closing connection: {e}")
+            self.logger.error("Critical error closing connection: %s", e)
         finally:
             # Ensure writer is cleared regardless of errors
             self.writer = None
@@ -5,6 +5,7 @@ Includes retry mechanisms, circuit breakers, and graceful degradation
 
 import asyncio
 import logging
+import re
 import time
 from functools import wraps
 from typing import Any, Callable, Optional, Union
@@ -269,8 +270,6 @@ def safe_format_message(template: str, **kwargs) -> str:
                 safe_kwargs[key] = ""
 
         # Replace missing variables with placeholders
-        import re
-
         def replace_missing(match):
             field = match.group(1)
             # A format field can be "name", "name!r", "name:>10", or "name!r:>10" -
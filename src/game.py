@@ -42,6 +42,27 @@ ACHIEVEMENTS = {
     },
 }
 
+# A channel's spawn wait sleeps in steps of this many seconds, re-reading
+# active bread effects between steps
+SPAWN_MULTIPLIER_RECHECK_SECS = 5
+
+# XP awarded per duck type on a kill:
+# duck_type -> (config path, legacy top-level key, default XP, message key)
+HIT_REWARDS = {
+    "golden": ("duck_types.golden.xp", "golden_duck_xp", 15, "bang_hit_golden_killed"),
+    "fast": ("duck_types.fast.xp", "fast_duck_xp", 12, "bang_hit_fast"),
+    "ninja": ("duck_types.ninja.xp", None, 14, "bang_hit_ninja"),
+    "flock": ("duck_types.normal.xp", "normal_duck_xp", 10, "bang_hit_flock"),
+    "normal": ("duck_types.normal.xp", "normal_duck_xp", 10, "bang_hit"),
+}
+
+# Fly-away message per duck type; anything else uses "duck_flies_away"
+FLY_AWAY_MESSAGES = {
+    "golden": "golden_duck_flies_away",
+    "fast": "fast_duck_flies_away",
+    "ninja": "ninja_duck_flies_away",
+}
+
 
 class DuckGame:
     """Game mechanics for DuckHunt - shooting, befriending, reloading"""
@@ -55,6 +76,8 @@ class DuckGame:
         self.timeout_task = None
         # Per-channel spawn tasks: {channel_key: asyncio.Task}
         self._channel_spawn_tasks = {}
+        # Duck ids only need to be unique for the bot's lifetime
+        self._next_duck_id = 0
 
     @staticmethod
     def _channel_key(channel: str) -> str:
@@ -152,20 +175,25 @@ class DuckGame:
                 self.logger.debug(
                     f"Next spawn in {channel_key} in {base_wait}s (range {min_wait}-{max_wait})"
                 )
-                # Re-check the spawn multiplier every second so a bread effect used
+                # Re-check the spawn multiplier during the wait so a bread effect used
                 # mid-wait shortens the remaining wait instead of only counting if it
                 # happened to be active when this cycle started (with hour-long waits,
-                # a 20-minute effect would otherwise usually expire unseen).
+                # a 20-minute effect would otherwise usually expire unseen). The check
+                # scans every player's effects in the channel, so the task sleeps
+                # straight through to the next recheck (or the spawn, if sooner)
+                # instead of waking every second in between.
                 elapsed = 0
                 while True:
                     spawn_multiplier = self._get_active_spawn_multiplier(channel)
                     effective_wait = base_wait
                     if spawn_multiplier > 1.0:
                         effective_wait = base_wait / spawn_multiplier
-                    if elapsed >= effective_wait:
+                    remaining = effective_wait - elapsed
+                    if remaining <= 0:
                         break
-                    await asyncio.sleep(1)
-                    elapsed += 1
+                    step = min(SPAWN_MULTIPLIER_RECHECK_SECS, remaining)
+                    await asyncio.sleep(step)
+                    elapsed += step
                 await self.spawn_duck(channel)
         except asyncio.CancelledError:
             self.logger.info(f"Spawn loop for {channel_key} cancelled")
@@ -178,19 +206,31 @@ class DuckGame:
                 current_time = time.time()
                 channels_to_clear = []
 
+                # Timeouts only change on config reload; resolve each type once per
+                # sweep rather than once per live duck.
+                timeouts = {}
                 for channel, ducks in self.ducks.items():
                     ducks_to_remove = []
+                    ducks_to_keep = []
                     for duck in ducks:
                         duck_type = duck.get("duck_type", "normal")
-                        effective_timeout = self.bot.get_config(
-                            f"duck_types.{duck_type}.timeout", 60
-                        )
+                        effective_timeout = timeouts.get(duck_type)
+                        if effective_timeout is None:
+                            effective_timeout = timeouts[duck_type] = self.bot.get_config(
+                                f"duck_types.{duck_type}.timeout", 60
+                            )
                         if current_time - duck["spawn_time"] > effective_timeout:
                             ducks_to_remove.append(duck)
+                        else:
+                            ducks_to_keep.append(duck)
+
+                    if ducks_to_remove:
+                        # One in-place rebuild keeps spawn order and avoids the
+                        # O(n) list.remove() per expired duck.
+                        ducks[:] = ducks_to_keep
 
                     flock_flyaways = 0
                     for duck in ducks_to_remove:
-                        ducks.remove(duck)
                         duck_type = duck.get("duck_type", "normal")
                         if self._trigger_hunting_dog(channel, duck):
                             continue  # Dog retrieved it — no fly-away message
@@ -199,12 +239,7 @@ class DuckGame:
                             # below instead of spamming one line per duck.
                             flock_flyaways += 1
                             continue
-                        msg_keys = {
-                            "golden": "golden_duck_flies_away",
-                            "fast": "fast_duck_flies_away",
-                            "ninja": "ninja_duck_flies_away",
-                        }
-                        msg_key = msg_keys.get(duck_type, "duck_flies_away")
+                        msg_key = FLY_AWAY_MESSAGES.get(duck_type, "duck_flies_away")
                         self.bot.send_message(channel, self.bot.messages.get(msg_key))
 
                     if flock_flyaways == 1:
@@ -234,10 +269,14 @@ class DuckGame:
     # Duck factory helpers
     # -----------------------------------------------------------------------
 
+    def new_duck_id(self):
+        """Return the next duck id (a per-process counter, no RNG draw)."""
+        self._next_duck_id += 1
+        return self._next_duck_id
+
     def _make_duck(self, duck_type, channel, channel_key, t, **extra):
-        prefix = duck_type
         base = {
-            "id": f"{prefix}_duck_{int(t)}_{random.randint(1000, 9999)}",
+            "id": self.new_duck_id(),
             "spawn_time": t,
             "channel": channel,
             "duck_type": duck_type,
@@ -317,9 +356,9 @@ class DuckGame:
     async def _spawn_flock(self, channel, channel_key, t):
         """Spawn a flock of 2-4 normal ducks."""
         flock_size = random.randint(2, 4)
-        for i in range(flock_size):
+        for _ in range(flock_size):
             duck = {
-                "id": f"flock_duck_{int(t)}_{i}_{random.randint(100, 999)}",
+                "id": self.new_duck_id(),
                 "spawn_time": t,
                 "channel": channel,
                 "duck_type": "flock",
@@ -341,16 +380,20 @@ class DuckGame:
     def shoot_duck(self, nick, channel, player):
         """Handle !bang command"""
         channel_key = self._channel_key(channel)
+        levels = self.bot.levels
+        # Up to three rolls per shot (jam, dodge, hit); bind the method once
+        roll = random.random
 
         # Bang cooldown
         cooldown = float(self.bot.get_config("gameplay.bang_cooldown", 1.5) or 1.5)
-        if time.time() - player.get("last_bang_time", 0) < cooldown:
+        now = time.time()
+        if now - player.get("last_bang_time", 0) < cooldown:
             return {
                 "success": False,
                 "message_key": "bang_cooldown",
                 "message_args": {"nick": nick},
             }
-        player["last_bang_time"] = time.time()
+        player["last_bang_time"] = now
 
         # Pre-shot checks
         if player.get("gun_confiscated", False):
@@ -365,7 +408,8 @@ class DuckGame:
                 "message_key": "bang_wet_clothes",
                 "message_args": {"nick": nick},
             }
-        if player.get("current_ammo", 0) <= 0:
+        ammo = player.get("current_ammo", 0)
+        if ammo <= 0:
             return {
                 "success": False,
                 "message_key": "bang_no_ammo",
@@ -373,10 +417,10 @@ class DuckGame:
             }
 
         # Gun jam check
-        base_jam = self.bot.levels.get_jam_chance(player)
-        if random.random() < max(0, min(100, base_jam)) / 100.0:
-            player["current_ammo"] = player.get("current_ammo", 1) - 1
-            self.db.save_database()
+        base_jam = levels.get_jam_chance(player)
+        if roll() < max(0, min(100, base_jam)) / 100.0:
+            player["current_ammo"] = ammo - 1
+            self.db.request_save()
             return {
                 "success": False,
                 "message_key": "bang_gun_jammed",
@@ -384,16 +428,17 @@ class DuckGame:
             }
 
         # Wild shot (no duck)?
-        if channel_key not in self.ducks or not self.ducks[channel_key]:
+        channel_ducks = self.ducks.get(channel_key)
+        if not channel_ducks:
             player["shots_fired"] = player.get("shots_fired", 0) + 1
             player["shots_missed"] = player.get("shots_missed", 0) + 1
-            player["confiscated_ammo"] = player.get("current_ammo", 0)
+            player["confiscated_ammo"] = ammo
             player["confiscated_magazines"] = player.get("magazines", 0)
             player["current_ammo"] = 0
             player["gun_confiscated"] = True
             player["gun_confiscated_count"] = player.get("gun_confiscated_count", 0) + 1
             player["current_streak"] = 0
-            self.db.save_database()
+            self.db.request_save()
             result = {
                 "success": False,
                 "message_key": "bang_no_duck",
@@ -404,14 +449,14 @@ class DuckGame:
                 result["new_achievements"] = new_ach
             return result
 
-        duck = self.ducks[channel_key][0]
+        duck = channel_ducks[0]
         duck_type = duck.get("duck_type", "normal")
 
-        player["current_ammo"] = player.get("current_ammo", 1) - 1
+        player["current_ammo"] = ammo - 1
         player["shots_fired"] = player.get("shots_fired", 0) + 1
 
         # Accuracy calculation
-        base_acc = self.bot.levels.get_modified_accuracy(player)
+        base_acc = levels.get_modified_accuracy(player)
         scope_bonus = self._apply_scope_effect(player)
         hit_chance = max(5, min(100, base_acc + scope_bonus)) / 100.0
 
@@ -426,11 +471,11 @@ class DuckGame:
         # Ninja dodge
         if duck_type == "ninja":
             dodge = float(duck.get("dodge_chance", 0.35))
-            if random.random() < dodge:
+            if roll() < dodge:
                 player["shots_missed"] = player.get("shots_missed", 0) + 1
                 player["xp"] = max(0, player.get("xp", 0) - 1)
                 player["current_streak"] = 0
-                self.db.save_database()
+                self.db.request_save()
                 return {
                     "success": True,
                     "hit": False,
@@ -438,7 +483,7 @@ class DuckGame:
                     "message_args": {"nick": nick},
                 }
 
-        if random.random() < hit_chance:
+        if roll() < hit_chance:
             return self._process_hit(
                 nick, channel, channel_key, player, duck, duck_type
             )
@@ -449,29 +494,31 @@ class DuckGame:
         """Handle a successful shot."""
         xp_mod = 1.0
         is_flock = duck.get("is_flock", False)
+        get_config = self.bot.get_config
+
+        config_path, legacy_key, default_xp, message_key = HIT_REWARDS.get(
+            duck_type, HIT_REWARDS["normal"]
+        )
+        if legacy_key:
+            default_xp = get_config(legacy_key, default_xp)
+        xp_gained = int(get_config(config_path, default_xp) * xp_mod)
+        accuracy_gain = get_config("gameplay.accuracy_gain_on_hit", 1)
+        max_accuracy = get_config("gameplay.max_accuracy", 100)
 
         # Boss duck — multi-contributor logic removed; boss duck no longer spawns.
         # Golden duck — multi-hit
         if duck_type == "golden":
             duck["current_hp"] -= 1
-            xp_gained = int(
-                self.bot.get_config(
-                    "duck_types.golden.xp", self.bot.get_config("golden_duck_xp", 15)
-                )
-                * xp_mod
-            )
             if duck["current_hp"] > 0:
                 player["accuracy"] = min(
-                    player.get("accuracy", 75)
-                    + self.bot.get_config("gameplay.accuracy_gain_on_hit", 1),
-                    self.bot.get_config("gameplay.max_accuracy", 100),
+                    player.get("accuracy", 75) + accuracy_gain, max_accuracy
                 )
                 # Grant this hit's XP immediately so the balance matches what the
                 # 'bang_hit_golden' message displays (previously this was silently
                 # withheld until the killing blow, which then granted xp_gained * max_hp
                 # in one lump sum - making every earlier "+xp" message a lie).
                 player["xp"] = player.get("xp", 0) + xp_gained
-                self.db.save_database()
+                self.db.request_save()
                 return {
                     "success": True,
                     "hit": True,
@@ -487,67 +534,34 @@ class DuckGame:
             # so the killing blow only grants xp_gained for this one hit (via the common
             # "Apply XP / stats" block below) - not xp_gained * max_hp, which would double
             # up the XP already credited for prior hits on the same duck.
-            self.ducks[channel_key].pop(0)
-            message_key = "bang_hit_golden_killed"
-        elif duck_type in ("fast",):
-            self.ducks[channel_key].pop(0)
-            xp_gained = int(
-                self.bot.get_config(
-                    "duck_types.fast.xp", self.bot.get_config("fast_duck_xp", 12)
-                )
-                * xp_mod
-            )
-            message_key = "bang_hit_fast"
-        elif duck_type == "ninja":
-            self.ducks[channel_key].pop(0)
-            xp_gained = int(self.bot.get_config("duck_types.ninja.xp", 14) * xp_mod)
-            message_key = "bang_hit_ninja"
-        elif duck_type == "flock":
-            self.ducks[channel_key].pop(0)
-            xp_gained = int(
-                self.bot.get_config(
-                    "duck_types.normal.xp", self.bot.get_config("normal_duck_xp", 10)
-                )
-                * xp_mod
-            )
-            message_key = "bang_hit_flock"
-        else:  # normal
-            self.ducks[channel_key].pop(0)
-            xp_gained = int(
-                self.bot.get_config(
-                    "duck_types.normal.xp", self.bot.get_config("normal_duck_xp", 10)
-                )
-                * xp_mod
-            )
-            message_key = "bang_hit"
+        self.ducks[channel_key].pop(0)
 
         # Apply XP / stats
-        old_level = self.bot.levels.calculate_player_level(player)
+        levels = self.bot.levels
+        old_level = levels.calculate_player_level(player)
         player["xp"] = player.get("xp", 0) + xp_gained
         player["ducks_shot"] = player.get("ducks_shot", 0) + 1
-        player["current_streak"] = player.get("current_streak", 0) + 1
-        if player["current_streak"] > player.get("best_streak", 0):
-            player["best_streak"] = player["current_streak"]
+        streak = player["current_streak"] = player.get("current_streak", 0) + 1
+        if streak > player.get("best_streak", 0):
+            player["best_streak"] = streak
         player["accuracy"] = min(
-            player.get("accuracy", 75)
-            + self.bot.get_config("gameplay.accuracy_gain_on_hit", 1),
-            self.bot.get_config("gameplay.max_accuracy", 100),
+            player.get("accuracy", 75) + accuracy_gain, max_accuracy
         )
-        new_level = self.bot.levels.calculate_player_level(player)
+        new_level = levels.calculate_player_level(player)
         if new_level != old_level:
-            self.bot.levels.update_player_magazines(player)
-        if self.bot.get_config("duck_spawning.rearm_on_duck_shot", False):
+            levels.update_player_magazines(player)
+        if get_config("duck_spawning.rearm_on_duck_shot", False):
             self._rearm_all_disarmed_players(channel)
 
         dropped_item = self._check_item_drop(player, duck_type)
         new_ach = self._check_achievements(player, "duck_shot", duck_type=duck_type)
-        self.db.save_database()
+        self.db.request_save()
 
         # Global announcement for golden duck kill
         if duck_type == "golden" and message_key == "bang_hit_golden_killed":
-            if self.bot.get_config("gameplay.global_announcements", False):
+            if get_config("gameplay.global_announcements", False):
                 for ch in list(self.bot.channels_joined):
-                    if self._channel_key(ch) != self._channel_key(channel):
+                    if self._channel_key(ch) != channel_key:
                         self.bot.send_message(
                             ch,
                             f"[Global] {nick} just slayed a Golden Duck in {channel}!",
@@ -580,7 +594,7 @@ class DuckGame:
 
         # Check body armor before applying XP loss
         if self._consume_body_armor(player):
-            self.db.save_database()
+            self.db.request_save()
             new_ach = self._check_achievements(player, "armor_used")
             result = {
                 "success": True,
@@ -602,17 +616,19 @@ class DuckGame:
         # Friendly fire chance
         friendly_fire_chance = 0.15
         if random.random() < friendly_fire_chance:
-            armed_players = [
-                (n, p)
+            # Only the victim's nick is used, so collect just the names
+            shooter = nick.lower()
+            armed_nicks = [
+                n
                 for n, p in self.db.get_players_for_channel(channel).items()
-                if str(n).lower() != nick.lower()
-                and not p.get("gun_confiscated", False)
+                if not p.get("gun_confiscated", False)
                 and p.get("current_ammo", 0) > 0
+                and str(n).lower() != shooter
             ]
-            if armed_players:
-                victim_nick, victim_player = random.choice(armed_players)
+            if armed_nicks:
+                victim_nick = random.choice(armed_nicks)
                 if self._check_insurance_protection(player, "friendly_fire"):
-                    self.db.save_database()
+                    self.db.request_save()
                     return {
                         "success": True,
                         "hit": False,
@@ -621,8 +637,9 @@ class DuckGame:
                         "message_key": "bang_friendly_fire_insured",
                         "message_args": {"nick": nick, "victim": victim_nick},
                     }
-                xp_loss = min(player.get("xp", 0) // 4, 25)
-                player["xp"] = max(0, player.get("xp", 0) - xp_loss)
+                xp = player.get("xp", 0)
+                xp_loss = min(xp // 4, 25)
+                player["xp"] = max(0, xp - xp_loss)
                 player["confiscated_ammo"] = player.get("current_ammo", 0)
                 player["confiscated_magazines"] = player.get("magazines", 0)
                 player["current_ammo"] = 0
@@ -630,7 +647,7 @@ class DuckGame:
                 player["gun_confiscated_count"] = (
                     player.get("gun_confiscated_count", 0) + 1
                 )
-                self.db.save_database()
+                self.db.request_save()
                 return {
                     "success": True,
                     "hit": False,
@@ -644,7 +661,7 @@ class DuckGame:
                     },
                 }
 
-        self.db.save_database()
+        self.db.request_save()
         return {
             "success": True,
             "hit": False,
@@ -660,14 +677,15 @@ class DuckGame:
         """Handle !bef command"""
         channel_key = self._channel_key(channel)
 
-        if channel_key not in self.ducks or not self.ducks[channel_key]:
+        channel_ducks = self.ducks.get(channel_key)
+        if not channel_ducks:
             return {
                 "success": False,
                 "message_key": "bef_no_duck",
                 "message_args": {"nick": nick},
             }
 
-        duck = self.ducks[channel_key][0]
+        duck = channel_ducks[0]
         duck_type = duck.get("duck_type", "normal")
 
         # Trap effect on player: !bef fails, XP penalty
@@ -678,7 +696,7 @@ class DuckGame:
             ]
             xp_loss = int(self.bot.get_config("duck_types.trap.xp_penalty", 5))
             player["xp"] = max(0, player.get("xp", 0) - xp_loss)
-            self.db.save_database()
+            self.db.request_save()
             return {
                 "success": False,
                 "message_key": "bef_trapped",
@@ -716,10 +734,10 @@ class DuckGame:
                 # Golden ducks require multiple successful befriend rolls to fully tame,
                 # mirroring !bang's multi-hit HP mechanic. Previously a single successful
                 # roll instantly befriended the duck regardless of its remaining HP.
-                duck["current_hp"] = duck.get("current_hp", 1) - 1
-                if duck["current_hp"] > 0:
+                hp = duck["current_hp"] = duck.get("current_hp", 1) - 1
+                if hp > 0:
                     player["xp"] = player.get("xp", 0) + xp_gained
-                    self.db.save_database()
+                    self.db.request_save()
                     return {
                         "success": True,
                         "befriended": False,
@@ -727,17 +745,17 @@ class DuckGame:
                         "message_args": {
                             "nick": nick,
                             "xp_gained": xp_gained,
-                            "hp_remaining": duck["current_hp"],
+                            "hp_remaining": hp,
                         },
                     }
 
-            self.ducks[channel_key].pop(0)
+            channel_ducks.pop(0)
             old_level = self.bot.levels.calculate_player_level(player)
             player["xp"] = player.get("xp", 0) + xp_gained
             player["ducks_befriended"] = player.get("ducks_befriended", 0) + 1
-            player["current_streak"] = player.get("current_streak", 0) + 1
-            if player["current_streak"] > player.get("best_streak", 0):
-                player["best_streak"] = player["current_streak"]
+            streak = player["current_streak"] = player.get("current_streak", 0) + 1
+            if streak > player.get("best_streak", 0):
+                player["best_streak"] = streak
             new_level = self.bot.levels.calculate_player_level(player)
             if new_level != old_level:
                 self.bot.levels.update_player_magazines(player)
@@ -746,7 +764,7 @@ class DuckGame:
             new_ach = self._check_achievements(
                 player, "duck_befriended", duck_type=duck_type
             )
-            self.db.save_database()
+            self.db.request_save()
             result = {
                 "success": True,
                 "befriended": True,
@@ -762,7 +780,7 @@ class DuckGame:
             return result
         else:
             player["current_streak"] = 0
-            self.db.save_database()
+            self.db.request_save()
             return {
                 "success": True,
                 "befriended": False,
@@ -795,6 +813,7 @@ class DuckGame:
         if player.get("magazines", 1) <= 1:
             inventory = player.get("inventory", {})
             magazine_item_id = None
+            magazine_qty = 0
             if hasattr(self.bot, "shop") and self.bot.shop:
                 for item_id_str, qty in inventory.items():
                     if qty > 0:
@@ -802,14 +821,16 @@ class DuckGame:
                             item = self.bot.shop.get_item(int(item_id_str))
                             if item and item.get("type") == "magazine":
                                 magazine_item_id = item_id_str
+                                magazine_qty = qty
                                 break
                         except ValueError:
                             pass
 
             if magazine_item_id:
                 # Auto consume 1 magazine item
-                inventory[magazine_item_id] -= 1
-                if inventory[magazine_item_id] <= 0:
+                if magazine_qty > 1:
+                    inventory[magazine_item_id] = magazine_qty - 1
+                else:
                     del inventory[magazine_item_id]
                 player["inventory"] = inventory
 
@@ -842,7 +863,7 @@ class DuckGame:
                         pass
         total_spares = active_spares + inv_mags
 
-        self.db.save_database()
+        self.db.request_save()
         return {
             "success": True,
             "message_key": "reload_success",
@@ -1045,7 +1066,10 @@ class DuckGame:
         current_time = time.time()
         try:
             for _ch, player_name, player_data in self.db.iter_all_players():
-                effects = player_data.get("temporary_effects", [])
+                effects = player_data.get("temporary_effects")
+                if not effects:
+                    # Most players carry no effects; skip building an empty list
+                    continue
                 active = [e for e in effects if e.get("expires_at", 0) > current_time]
                 if len(active) != len(effects):
                     player_data["temporary_effects"] = active
@@ -1083,43 +1107,37 @@ class DuckGame:
             drop_table = self.bot.get_config(f"item_drops.{duck_type}_duck_drops", [])
             if not drop_table:
                 return None
-            total_weight = sum(item.get("weight", 1) for item in drop_table)
-            if total_weight <= 0:
+            weights = [item.get("weight", 1) for item in drop_table]
+            if sum(weights) <= 0:
                 return None
-            random_weight = random.randint(1, total_weight)
-            current_weight = 0
-            for drop_item in drop_table:
-                current_weight += drop_item.get("weight", 1)
-                if random_weight <= current_weight:
-                    item_id = drop_item.get("item_id")
-                    if item_id:
-                        inventory = player.get("inventory", {})
-                        # Respect inventory limits (same caps the shop enforces)
-                        max_total = int(
-                            self.bot.get_config("limits.max_inventory_items", 20)
-                        )
-                        if sum(inventory.values()) >= max_total:
-                            self.logger.debug(
-                                f"Inventory full for {player.get('nick', '?')}, drop discarded"
-                            )
-                            return None
-                        inventory[str(item_id)] = inventory.get(str(item_id), 0) + 1
-                        player["inventory"] = inventory
-                        item_info = self.bot.shop.get_item(item_id)
-                        item_name = (
-                            item_info.get("name", f"Item {item_id}")
-                            if item_info
-                            else f"Item {item_id}"
-                        )
-                        self.logger.info(
-                            f"Duck dropped {item_name} for {player.get('nick', '?')}"
-                        )
-                        return {
-                            "item_id": item_id,
-                            "item_name": item_name,
-                            "duck_type": duck_type,
-                        }
-                    break
+            # Same weighted pick as the shop's mystery box
+            drop_item = random.choices(drop_table, weights=weights, k=1)[0]
+            item_id = drop_item.get("item_id")
+            if item_id:
+                inventory = player.get("inventory", {})
+                # Respect inventory limits (same caps the shop enforces)
+                max_total = int(self.bot.get_config("limits.max_inventory_items", 20))
+                if sum(inventory.values()) >= max_total:
+                    self.logger.debug(
+                        f"Inventory full for {player.get('nick', '?')}, drop discarded"
+                    )
+                    return None
+                inventory[str(item_id)] = inventory.get(str(item_id), 0) + 1
+                player["inventory"] = inventory
+                item_info = self.bot.shop.get_item(item_id)
+                item_name = (
+                    item_info.get("name", f"Item {item_id}")
+                    if item_info
+                    else f"Item {item_id}"
+                )
+                self.logger.info(
+                    f"Duck dropped {item_name} for {player.get('nick', '?')}"
+                )
+                return {
+                    "item_id": item_id,
+                    "item_name": item_name,
+                    "duck_type": duck_type,
+                }
         except Exception as e:
             self.logger.error(f"Error in _check_item_drop: {e}")
         return None
@@ -3,6 +3,7 @@ Level system for DuckHunt Bot
 Manages player levels and difficulty scaling
 """
 
+import bisect
 import json
 import logging
 import os
@@ -15,6 +16,9 @@ class LevelManager:
     def __init__(self, levels_file: str = "levels.json"):
         self.levels_file = levels_file
         self.levels_data = {}
+        # Sorted lookup index over levels_data, rebuilt by load_levels()
+        self._level_numbers = []
+        self._level_thresholds = []
         self.logger = logging.getLogger("DuckHuntBot.Levels")
         self.load_levels()
 
@@ -37,6 +41,32 @@ class LevelManager:
         except Exception as e:
             self.logger.error(f"Error loading levels: {e}, using defaults")
             self.levels_data = self._get_default_levels()
+        self._build_level_index()
+
+    def _build_level_index(self):
+        """Precompute the arrays calculate_player_level bisects over.
+
+        `_level_thresholds[i]` is the lowest min_xp/min_ducks of level
+        `_level_numbers[i]` or any level above it, so the list is non-decreasing even
+        if levels.json thresholds are not, and the highest level a value qualifies for
+        is simply the last index whose threshold it reaches.
+        """
+        levels = self.levels_data.get("levels", {})
+        numbers = sorted(int(level_num) for level_num in levels)
+        thresholds = []
+        lowest = None
+        for level_num in reversed(numbers):
+            level_data = levels[str(level_num)]
+            # Check for XP-based thresholds first, fallback to duck-based
+            threshold = level_data.get("min_xp", level_data.get("min_ducks", 0))
+            lowest = threshold if lowest is None else min(lowest, threshold)
+            thresholds.append(lowest)
+        thresholds.reverse()
+        self._level_numbers = numbers
+        self._level_thresholds = thresholds
+        self._level_method = self.levels_data.get("level_calculation", {}).get(
+            "method", "xp"
+        )
 
     def _get_default_levels(self) -> Dict[str, Any]:
         """Default fallback level system"""
@@ -69,7 +99,7 @@ class LevelManager:
 
     def calculate_player_level(self, player: Dict[str, Any]) -> int:
         """Calculate a player's current level based on their stats"""
-        method = self.levels_data.get("level_calculation", {}).get("method", "xp")
+        method = self._level_method
 
         if method == "xp":
             player_xp = player.get("xp", 0)
@@ -83,13 +113,9 @@ class LevelManager:
             player_xp = player.get("xp", 0)
 
         # Find the appropriate level
-        levels = self.levels_data.get("levels", {})
-        for level_num in sorted(levels.keys(), key=int, reverse=True):
-            level_data = levels[level_num]
-            # Check for XP-based thresholds first, fallback to duck-based
-            min_threshold = level_data.get("min_xp", level_data.get("min_ducks", 0))
-            if player_xp >= min_threshold:
-                return int(level_num)
+        index = bisect.bisect_right(self._level_thresholds, player_xp) - 1
+        if index >= 0:
+            return self._level_numbers[index]
 
         return 1  # Default to level 1
 
@@ -97,6 +123,14 @@ class LevelManager:
         """Get level data for a specific level"""
         return self.levels_data.get("levels", {}).get(str(level))
 
+    def _player_level_data(self, player: Dict[str, Any]) -> Dict[str, Any]:
+        """Raw levels.json entry for the player's level ({} if there is none).
+
+        The per-shot modifier lookups below only need one field each, so they read it
+        from here instead of building the full get_player_level_info() dict.
+        """
+        return self.get_level_data(self.calculate_player_level(player)) or {}
+
     def get_player_level_info(self, player: Dict[str, Any]) -> Dict[str, Any]:
         """Get complete level information for a player"""
         level = self.calculate_player_level(player)
@@ -159,8 +193,7 @@ class LevelManager:
         base_accuracy = player.get(
             "accuracy", 75
         )  # This will be updated by bot config in create_player
-        level_info = self.get_player_level_info(player)
-        modifier = level_info.get("accuracy_modifier", 0)
+        modifier = self._player_level_data(player).get("accuracy_modifier", 0)
 
         # Apply modifier and clamp between 10-100
         modified_accuracy = base_accuracy + modifier
@@ -170,18 +203,16 @@ class LevelManager:
         self, player: Dict[str, Any], base_rate: float = 75.0
     ) -> float:
         """Get player's befriend success rate modified by their level"""
-        level_info = self.get_player_level_info(player)
-        level_rate = level_info.get("befriend_success_rate", base_rate)
+        level_rate = self._player_level_data(player).get("befriend_success_rate", 75)
 
         # Return as percentage (0-100) - these will be configurable later if bot reference is available
         return max(5.0, min(95.0, level_rate))
 
     def get_jam_chance(self, player: Dict[str, Any]) -> float:
         """Get player's gun jam chance based on their level"""
-        level_info = self.get_player_level_info(player)
-        level_data = self.get_level_data(level_info["level"])
+        level_data = self._player_level_data(player)
 
-        if level_data and "jam_chance" in level_data:
+        if "jam_chance" in level_data:
             return level_data["jam_chance"]
 
         # Fallback to old system if no level-specific jam chance
@@ -3,13 +3,52 @@ Enhanced logging utilities for DuckHunt Bot
 Features: Colors, level labels, file rotation, structured formatting, configurable debug levels
 """
 
-import json
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 
+from .config_loader import load_config as load_config_file
+
+# Background listeners that drain each logger's file-handler queue, keyed by logger
+# name so a repeated setup_logger() call can stop the one it replaces
+_file_listeners = {}
+
+
+def stop_file_listeners():
+    """Flush and stop every queued file handler.
+
+    Registered with atexit; also call it directly before anything that ends the
+    process without running atexit hooks (os.execv), or queued records are lost.
+    """
+    for listener in list(_file_listeners.values()):
+        listener.stop()
+    _file_listeners.clear()
+
+
+atexit.register(stop_file_listeners)
+
+
+def _attach_queued_handler(logger, handler, level):
+    """Attach `handler` to `logger` behind a QueueHandler/QueueListener pair.
+
+    Records are queued on the calling thread and written (and rotated) on the
+    listener's own thread, so disk I/O never stalls the bot's asyncio event loop.
+    """
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    logger.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, handler, respect_handler_level=True
+    )
+    listener.start()
+    _file_listeners[logger.name] = listener
+
 
 def load_config():
     """Load configuration from config.json relative to the project root."""
@@ -18,9 +57,7 @@ def load_config():
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     config_path = os.path.join(project_root, "config.json")
     try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
-        return config
+        return load_config_file(config_path)
     except Exception as e:
         print(f"Warning: Could not load config.json ({config_path}): {e}")
         return {
@@ -262,6 +299,9 @@ def setup_logger(name="DuckHuntBot", console_level=None, file_level=None):
     logger.setLevel(logging.DEBUG if debug_enabled else logging.WARNING)
 
     # Clear existing handlers to avoid duplicates
+    previous_listener = _file_listeners.pop(name, None)
+    if previous_listener is not None:
+        previous_listener.stop()
     logger.handlers.clear()
 
     # This function always gives `logger` its own complete set of handlers below, so if
@@ -306,7 +346,7 @@ def setup_logger(name="DuckHuntBot", console_level=None, file_level=None):
         else:
             main_log_formatter = EnhancedFileFormatter()
         main_log_handler.setFormatter(main_log_formatter)
-        logger.addHandler(main_log_handler)
+        _attach_queued_handler(logger, main_log_handler, file_level)
 
         # Log initialization success with config info
         logger.info("Unified logging system initialized: all logs in duckhunt.log")
@@ -0,0 +1,53 @@
+"""
+JSON serialization helpers for DuckHunt Bot
+Uses orjson or msgspec when one is installed and falls back to the stdlib json module otherwise
+"""
+
+try:
+    import orjson as _json
+
+    loads = _json.loads
+    DecodeError = _json.JSONDecodeError
+
+    def dumps(obj) -> bytes:
+        """Compact, single-line JSON as UTF-8 bytes."""
+        return _json.dumps(obj)
+
+    def dumps_pretty(obj) -> bytes:
+        """Indented, key-sorted JSON as UTF-8 bytes (the on-disk database format)."""
+        return _json.dumps(obj, option=_json.OPT_INDENT_2 | _json.OPT_SORT_KEYS)
+
+except ImportError:
+    try:
+        import msgspec
+        import msgspec.json as _json
+
+        loads = _json.decode
+        DecodeError = msgspec.DecodeError
+
+        def dumps(obj) -> bytes:
+            """Compact, single-line JSON as UTF-8 bytes."""
+            return _json.encode(obj)
+
+        def dumps_pretty(obj) -> bytes:
+            """Indented, key-sorted JSON as UTF-8 bytes (the on-disk database format)."""
+            return _json.format(_json.encode(obj, order="sorted"), indent=2)
+
+    except ImportError:
+        import json as _json
+
+        loads = _json.loads
+        DecodeError = _json.JSONDecodeError
+
+        def dumps(obj) -> bytes:
+            """Compact, single-line JSON as UTF-8 bytes."""
+            return _json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+        def dumps_pretty(obj) -> bytes:
+            """Indented, key-sorted JSON as UTF-8 bytes (the on-disk database format)."""
+            return _json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=True).encode()
+
+# All three parsers accept bytes, so callers can read files in binary mode and skip
+# the separate UTF-8 decode step. Decoding bytes that are not valid UTF-8 raises a
+# ValueError subclass rather than DecodeError with the stdlib parser, so callers
+# catch both.
@@ -6,8 +6,12 @@ Handles loading items, purchasing, and item effects including player-vs-player a
 import json
 import logging
 import os
+import random
 import time
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from .config_loader import load_config
 
 
 class ShopManager:
@@ -17,7 +21,14 @@ class ShopManager:
         self.shop_file = shop_file
         self.levels = levels_manager
         self.items = {}
+        # Derived from self.items by _index_items() whenever items are (re)loaded
+        self.item_ids = frozenset()
+        self._sorted_items = ()
+        self._menu_lines = ()
+        self._menu_summary = ""
         self.logger = logging.getLogger("DuckHuntBot.Shop")
+        # Item type -> effect method, so _apply_item_effect is a single lookup
+        self._effect_handlers = self._build_effect_handlers()
         # Load inventory limits once at startup instead of on every purchase
         self.max_per_item = 99
         self.max_total_items = 20
@@ -31,8 +42,7 @@ class ShopManager:
                 os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
                 "config.json",
             )
-            with open(config_path, "r") as f:
-                config = json.load(f)
+            config = load_config(config_path)
             limits = config.get("limits", {})
             self.max_total_items = limits.get(
                 "max_inventory_items", self.max_total_items
@@ -62,6 +72,21 @@ class ShopManager:
         except Exception as e:
             self.logger.error(f"Error loading shop items: {e}, using defaults")
             self.items = self._get_default_items()
+        self._index_items()
+
+    def _index_items(self):
+        """Build the read-only views of the item table served to callers."""
+        self.item_ids = frozenset(str(item_id) for item_id in self.items)
+        self._sorted_items = tuple(sorted(self.items.items()))
+        # The !shop menu text only changes when the items do, so format it here
+        self._menu_lines = tuple(
+            f"  ({item_id}) {item['name']} - {item['price']} XP — {item.get('description', '')}"
+            for item_id, item in self._sorted_items
+        )
+        self._menu_summary = " | ".join(
+            f"({item_id}) {item['name']} {item['price']}XP"
+            for item_id, item in self._sorted_items
+        )
 
     def _get_default_items(self) -> Dict[int, Dict[str, Any]]:
         """Default fallback shop items matching shop.json"""
@@ -119,9 +144,21 @@ class ShopManager:
             },
         }
 
-    def get_items(self) -> Dict[int, Dict[str, Any]]:
-        """Get all shop items"""
-        return self.items.copy()
+    def get_items(self) -> Mapping[int, Dict[str, Any]]:
+        """Get all shop items (a read-only view, not a copy)"""
+        return MappingProxyType(self.items)
+
+    def sorted_items(self) -> tuple:
+        """All shop items as (item_id, item) pairs ordered by id"""
+        return self._sorted_items
+
+    def menu_lines(self) -> tuple:
+        """One preformatted line per item for the full !shop menu"""
+        return self._menu_lines
+
+    def menu_summary(self) -> str:
+        """Single-line "(id) name priceXP | ..." item list for usage hints"""
+        return self._menu_summary
 
     def get_item(self, item_id: int) -> Optional[Dict[str, Any]]:
         """Get a specific shop item by ID"""
@@ -399,375 +436,433 @@ class ShopManager:
         both.
         """
         item_type = item.get("type", "unknown")
-        amount = item.get("amount", 0)
+        handler = self._effect_handlers.get(item_type)
+        if handler is None:
+            self.logger.warning(f"Unknown item type: {item_type}")
+            return {"type": "unknown", "message": f"Unknown effect type: {item_type}"}
+        return handler(player, item, buyer)
 
-        if item_type == "ammo":
-            # Add bullets to current magazine
-            current_ammo = player.get("current_ammo", 0)
-            bullets_per_mag = player.get("bullets_per_magazine", 6)
-            new_ammo = min(current_ammo + amount, bullets_per_mag)
-            added_bullets = new_ammo - current_ammo
-            player["current_ammo"] = new_ammo
-            return {
-                "type": "ammo",
-                "added": added_bullets,
-                "new_total": new_ammo,
-                "max": bullets_per_mag,
-            }
+    def _build_effect_handlers(self):
+        """Map each item type to the method that applies its effect."""
 
-        elif item_type == "magazine":
-            # Add magazines (limit checking is done before this function is called)
-            current_magazines = player.get("magazines", 1)
+        def item_only(method):
+            return lambda player, item, buyer: method(item)
 
-            if self.levels:
-                level_info = self.levels.get_player_level_info(player)
-                max_magazines = level_info.get("magazines", 3)
-                # Don't exceed maximum magazines for level
-                magazines_to_add = min(amount, max_magazines - current_magazines)
-            else:
-                # Fallback if levels not available
-                magazines_to_add = amount
+        def player_and_item(method):
+            return lambda player, item, buyer: method(player, item)
 
-            new_magazines = current_magazines + magazines_to_add
-            player["magazines"] = new_magazines
-            return {
-                "type": "magazine",
-                "added": magazines_to_add,
-                "new_total": new_magazines,
-            }
+        return {
+            "ammo": self._effect_ammo,
+            "magazine": self._effect_magazine,
+            "accuracy": self._effect_accuracy,
+            "luck": self._effect_luck,
+            "jam_resistance": self._effect_jam_resistance,
+            "duck_attraction": self._effect_duck_attraction,
+            "critical_hit": self._effect_critical_hit,
+            "sabotage_jam": self._effect_sabotage_jam,
+            "sabotage_accuracy": self._effect_sabotage_accuracy,
+            "steal_ammo": self._effect_steal_ammo,
+            "clean_gun": self._effect_clean_gun,
+            "attract_ducks": self._effect_attract_ducks,
+            "clover_luck": self._effect_clover_luck,
+            "insurance": self._effect_insurance,
+            "buy_gun_back": self._effect_buy_gun_back,
+            "dry_clothes": self._effect_dry_clothes,
+            "reveal_duck": item_only(self._handle_reveal_duck),
+            "second_chance": player_and_item(self._handle_second_chance),
+            "temporary_accuracy": player_and_item(self._handle_temporary_accuracy),
+            "trap": player_and_item(self._handle_trap),
+            "mystery": player_and_item(self._handle_mystery_box),
+            "xp_shield": player_and_item(self._handle_xp_shield),
+        }
 
-        elif item_type == "accuracy":
-            # Increase accuracy up to 100%
-            current_accuracy = player.get("accuracy", 75)
-            new_accuracy = min(current_accuracy + amount, 100)
-            player["accuracy"] = new_accuracy
-            return {
-                "type": "accuracy",
-                "added": new_accuracy - current_accuracy,
-                "new_total": new_accuracy,
-            }
+    def _effect_ammo(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Add bullets to current magazine"""
+        amount = item.get("amount", 0)
+        current_ammo = player.get("current_ammo", 0)
+        bullets_per_mag = player.get("bullets_per_magazine", 6)
+        new_ammo = min(current_ammo + amount, bullets_per_mag)
+        added_bullets = new_ammo - current_ammo
+        player["current_ammo"] = new_ammo
+        return {
+            "type": "ammo",
+            "added": added_bullets,
+            "new_total": new_ammo,
+            "max": bullets_per_mag,
+        }
 
-        elif item_type == "luck":
-            # Store luck bonus (would be used in duck spawning logic)
-            current_luck = player.get("luck_bonus", 0)
-            new_luck = min(
-                max(current_luck + amount, -50), 100
-            )  # Bounded between -50 and +100
-            player["luck_bonus"] = new_luck
-            return {
-                "type": "luck",
-                "added": new_luck - current_luck,
-                "new_total": new_luck,
-            }
+    def _effect_magazine(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Add magazines (limit checking is done before this function is called)"""
+        amount = item.get("amount", 0)
+        current_magazines = player.get("magazines", 1)
 
-        elif item_type == "jam_resistance":
-            # Reduce gun jamming chance (lower is better)
-            current_jam = player.get("jam_chance", 5)  # Default 5% jam chance
-            new_jam = max(current_jam - amount, 0)  # Can't go below 0%
-            player["jam_chance"] = new_jam
-            return {
-                "type": "jam_resistance",
-                "reduced": current_jam - new_jam,
-                "new_total": new_jam,
-            }
+        if self.levels:
+            level_info = self.levels.get_player_level_info(player)
+            max_magazines = level_info.get("magazines", 3)
+            # Don't exceed maximum magazines for level
+            magazines_to_add = min(amount, max_magazines - current_magazines)
+        else:
+            # Fallback if levels not available
+            magazines_to_add = amount
 
-        elif item_type == "duck_attraction":
-            # Increase chance of ducks appearing when this player is online
-            current_attraction = player.get("duck_attraction", 0)
-            new_attraction = current_attraction + amount
-            player["duck_attraction"] = new_attraction
-            return {
-                "type": "duck_attraction",
-                "added": amount,
-                "new_total": new_attraction,
-            }
+        new_magazines = current_magazines + magazines_to_add
+        player["magazines"] = new_magazines
+        return {
+            "type": "magazine",
+            "added": magazines_to_add,
+            "new_total": new_magazines,
+        }
 
-        elif item_type == "critical_hit":
-            # Chance for critical hits (double XP)
-            current_crit = player.get("critical_chance", 0)
-            new_crit = min(current_crit + amount, 25)  # Max 25% crit chance
-            player["critical_chance"] = new_crit
-            return {
-                "type": "critical_hit",
-                "added": new_crit - current_crit,
-                "new_total": new_crit,
-            }
+    def _effect_accuracy(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Increase accuracy up to 100%"""
+        amount = item.get("amount", 0)
+        current_accuracy = player.get("accuracy", 75)
+        new_accuracy = min(current_accuracy + amount, 100)
+        player["accuracy"] = new_accuracy
+        return {
+            "type": "accuracy",
+            "added": new_accuracy - current_accuracy,
+            "new_total": new_accuracy,
+        }
 
-        elif item_type == "sabotage_jam":
-            # Increase target's gun jamming chance temporarily
-            current_jam = player.get("jam_chance", 5)
-            new_jam = min(current_jam + amount, 50)  # Max 50% jam chance
-            player["jam_chance"] = new_jam
-
-            # Add temporary effect tracking
-            if "temporary_effects" not in player:
-                player["temporary_effects"] = []
-
-            effect = {
-                "type": "jam_increase",
-                "amount": amount,
-                "expires_at": time.time()
-                + item.get("duration", 5) * 60,  # duration in minutes
-            }
-            player["temporary_effects"].append(effect)
+    def _effect_luck(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Store luck bonus (would be used in duck spawning logic)"""
+        amount = item.get("amount", 0)
+        current_luck = player.get("luck_bonus", 0)
+        new_luck = min(
+            max(current_luck + amount, -50), 100
+        )  # Bounded between -50 and +100
+        player["luck_bonus"] = new_luck
+        return {
+            "type": "luck",
+            "added": new_luck - current_luck,
+            "new_total": new_luck,
+        }
 
-            return {
-                "type": "sabotage_jam",
-                "added": new_jam - current_jam,
-                "new_total": new_jam,
-                "duration": item.get("duration", 5),
-            }
+    def _effect_jam_resistance(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Reduce gun jamming chance (lower is better)"""
+        amount = item.get("amount", 0)
+        current_jam = player.get("jam_chance", 5)  # Default 5% jam chance
+        new_jam = max(current_jam - amount, 0)  # Can't go below 0%
+        player["jam_chance"] = new_jam
+        return {
+            "type": "jam_resistance",
+            "reduced": current_jam - new_jam,
+            "new_total": new_jam,
+        }
 
-        elif item_type == "sabotage_accuracy":
-            # Reduce target's accuracy temporarily
-            current_acc = player.get("accuracy", 75)
-            new_acc = max(
-                current_acc + amount, 10
-            )  # Min 10% accuracy (amount is negative)
-            player["accuracy"] = new_acc
-
-            # Add temporary effect tracking
-            if "temporary_effects" not in player:
-                player["temporary_effects"] = []
-
-            effect = {
-                "type": "accuracy_reduction",
-                "amount": amount,
-                "expires_at": time.time() + item.get("duration", 3) * 60,
-            }
-            player["temporary_effects"].append(effect)
+    def _effect_duck_attraction(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Increase chance of ducks appearing when this player is online"""
+        amount = item.get("amount", 0)
+        current_attraction = player.get("duck_attraction", 0)
+        new_attraction = current_attraction + amount
+        player["duck_attraction"] = new_attraction
+        return {
+            "type": "duck_attraction",
+            "added": amount,
+            "new_total": new_attraction,
+        }
 
-            return {
-                "type": "sabotage_accuracy",
-                "reduced": current_acc - new_acc,
-                "new_total": new_acc,
-                "duration": item.get("duration", 3),
-            }
+    def _effect_critical_hit(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Chance for critical hits (double XP)"""
+        amount = item.get("amount", 0)
+        current_crit = player.get("critical_chance", 0)
+        new_crit = min(current_crit + amount, 25)  # Max 25% crit chance
+        player["critical_chance"] = new_crit
+        return {
+            "type": "critical_hit",
+            "added": new_crit - current_crit,
+            "new_total": new_crit,
+        }
 
-        elif item_type == "steal_ammo":
-            # Steal ammo from the target (`player`) and credit it to the buyer.
-            # Requires a distinct `buyer` (passed by `purchase_item` for target_required
-            # items) - previously this only ever removed ammo from the target and never
-            # credited anyone, since the function had no way to reference the buyer at all.
-            current_ammo = player.get("current_ammo", 0)
-            stolen = min(amount, current_ammo)
-            player["current_ammo"] = max(current_ammo - stolen, 0)
-
-            credited = 0
-            if buyer is not None and buyer is not player and stolen > 0:
-                buyer_ammo = buyer.get("current_ammo", 0)
-                buyer_mag_cap = buyer.get("bullets_per_magazine", 6)
-                new_buyer_ammo = min(buyer_ammo + stolen, buyer_mag_cap)
-                credited = new_buyer_ammo - buyer_ammo
-                buyer["current_ammo"] = new_buyer_ammo
+    def _effect_sabotage_jam(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Increase target's gun jamming chance temporarily"""
+        amount = item.get("amount", 0)
+        current_jam = player.get("jam_chance", 5)
+        new_jam = min(current_jam + amount, 50)  # Max 50% jam chance
+        player["jam_chance"] = new_jam
 
-            return {
-                "type": "steal_ammo",
-                "stolen": stolen,
-                "credited": credited,
-                "remaining": player["current_ammo"],
-            }
+        # Add temporary effect tracking
+        if "temporary_effects" not in player:
+            player["temporary_effects"] = []
 
-        elif item_type == "clean_gun":
-            # Clean gun to reduce jamming chance (positive amount reduces jam chance)
-            current_jam = player.get("jam_chance", 5)  # Default 5% jam chance
-            new_jam = min(
-                max(current_jam + amount, 0), 100
-            )  # Bounded between 0% and 100%
-            player["jam_chance"] = new_jam
+        effect = {
+            "type": "jam_increase",
+            "amount": amount,
+            "expires_at": time.time()
+            + item.get("duration", 5) * 60,  # duration in minutes
+        }
+        player["temporary_effects"].append(effect)
 
-            return {
-                "type": "clean_gun",
-                "reduced": current_jam - new_jam,
-                "new_total": new_jam,
-            }
+        return {
+            "type": "sabotage_jam",
+            "added": new_jam - current_jam,
+            "new_total": new_jam,
+            "duration": item.get("duration", 5),
+        }
 
-        elif item_type == "attract_ducks":
-            # Add bread effect to increase duck spawn rate
-            if "temporary_effects" not in player:
-                player["temporary_effects"] = []
+    def _effect_sabotage_accuracy(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Reduce target's accuracy temporarily"""
+        amount = item.get("amount", 0)
+        current_acc = player.get("accuracy", 75)
+        new_acc = max(
+            current_acc + amount, 10
+        )  # Min 10% accuracy (amount is negative)
+        player["accuracy"] = new_acc
 
-            duration = item.get("duration", 600)  # 10 minutes default
-            spawn_multiplier = item.get(
-                "spawn_multiplier", 2.0
-            )  # 2x spawn rate default
+        # Add temporary effect tracking
+        if "temporary_effects" not in player:
+            player["temporary_effects"] = []
 
-            effect = {
-                "type": "attract_ducks",
-                "spawn_multiplier": spawn_multiplier,
-                "expires_at": time.time() + duration,
-            }
-            player["temporary_effects"].append(effect)
+        effect = {
+            "type": "accuracy_reduction",
+            "amount": amount,
+            "expires_at": time.time() + item.get("duration", 3) * 60,
+        }
+        player["temporary_effects"].append(effect)
 
-            return {
-                "type": "attract_ducks",
-                "spawn_multiplier": spawn_multiplier,
-                "duration": duration // 60,  # return duration in minutes
-            }
+        return {
+            "type": "sabotage_accuracy",
+            "reduced": current_acc - new_acc,
+            "new_total": new_acc,
+            "duration": item.get("duration", 3),
+        }
 
-        elif item_type == "clover_luck":
-            # Temporarily boost hit + befriend success rates
-            if "temporary_effects" not in player or not isinstance(
-                player.get("temporary_effects"), list
-            ):
-                player["temporary_effects"] = []
-
-            duration = item.get("duration", 600)  # seconds
-            try:
-                duration = int(duration)
-            except (ValueError, TypeError):
-                duration = 600
-            duration = max(30, min(duration, 86400))
-
-            try:
-                min_hit = float(item.get("min_hit_chance", 0.95))
-            except (ValueError, TypeError):
-                min_hit = 0.95
-            try:
-                min_bef = float(item.get("min_befriend_chance", 0.95))
-            except (ValueError, TypeError):
-                min_bef = 0.95
-            min_hit = max(0.0, min(min_hit, 1.0))
-            min_bef = max(0.0, min(min_bef, 1.0))
-
-            now = time.time()
-            expires_at = now + duration
-
-            # If an existing clover effect is active, extend it instead of stacking.
-            for effect in player["temporary_effects"]:
-                if (
-                    isinstance(effect, dict)
-                    and effect.get("type") == "clover_luck"
-                    and effect.get("expires_at", 0) > now
-                ):
-                    effect["expires_at"] = (
-                        max(effect.get("expires_at", now), now) + duration
-                    )
-                    effect["min_hit_chance"] = max(
-                        float(effect.get("min_hit_chance", 0.0) or 0.0), min_hit
-                    )
-                    effect["min_befriend_chance"] = max(
-                        float(effect.get("min_befriend_chance", 0.0) or 0.0), min_bef
-                    )
-                    return {
-                        "type": "clover_luck",
-                        "duration": duration // 60,
-                        "min_hit_chance": min_hit,
-                        "min_befriend_chance": min_bef,
-                        "extended": True,
-                    }
+    def _effect_steal_ammo(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Steal ammo from the target (`player`) and credit it to the buyer."""
+        amount = item.get("amount", 0)
+        # Requires a distinct `buyer` (passed by `purchase_item` for target_required
+        # items) - previously this only ever removed ammo from the target and never
+        # credited anyone, since the function had no way to reference the buyer at all.
+        current_ammo = player.get("current_ammo", 0)
+        stolen = min(amount, current_ammo)
+        player["current_ammo"] = max(current_ammo - stolen, 0)
+
+        credited = 0
+        if buyer is not None and buyer is not player and stolen > 0:
+            buyer_ammo = buyer.get("current_ammo", 0)
+            buyer_mag_cap = buyer.get("bullets_per_magazine", 6)
+            new_buyer_ammo = min(buyer_ammo + stolen, buyer_mag_cap)
+            credited = new_buyer_ammo - buyer_ammo
+            buyer["current_ammo"] = new_buyer_ammo
 
-            effect = {
-                "type": "clover_luck",
-                "min_hit_chance": min_hit,
-                "min_befriend_chance": min_bef,
-                "expires_at": expires_at,
-            }
-            player["temporary_effects"].append(effect)
+        return {
+            "type": "steal_ammo",
+            "stolen": stolen,
+            "credited": credited,
+            "remaining": player["current_ammo"],
+        }
 
-            return {
-                "type": "clover_luck",
-                "duration": duration // 60,
-                "min_hit_chance": min_hit,
-                "min_befriend_chance": min_bef,
-                "extended": False,
-            }
+    def _effect_clean_gun(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Clean gun to reduce jamming chance (positive amount reduces jam chance)"""
+        amount = item.get("amount", 0)
+        current_jam = player.get("jam_chance", 5)  # Default 5% jam chance
+        new_jam = min(
+            max(current_jam + amount, 0), 100
+        )  # Bounded between 0% and 100%
+        player["jam_chance"] = new_jam
 
-        elif item_type == "insurance":
-            # Add insurance protection against friendly fire
-            if "temporary_effects" not in player:
-                player["temporary_effects"] = []
+        return {
+            "type": "clean_gun",
+            "reduced": current_jam - new_jam,
+            "new_total": new_jam,
+        }
 
-            duration = item.get("duration", 86400)  # 24 hours default
-            protection_type = item.get("protection", "friendly_fire")
+    def _effect_attract_ducks(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Add bread effect to increase duck spawn rate"""
+        if "temporary_effects" not in player:
+            player["temporary_effects"] = []
 
-            effect = {
-                "type": "insurance",
-                "protection": protection_type,
-                "expires_at": time.time() + duration,
-                "name": "Hunter's Insurance",
-            }
-            player["temporary_effects"].append(effect)
+        duration = item.get("duration", 600)  # 10 minutes default
+        spawn_multiplier = item.get(
+            "spawn_multiplier", 2.0
+        )  # 2x spawn rate default
 
-            return {
-                "type": "insurance",
-                "protection": protection_type,
-                "duration": duration // 3600,  # return duration in hours
-            }
+        effect = {
+            "type": "attract_ducks",
+            "spawn_multiplier": spawn_multiplier,
+            "expires_at": time.time() + duration,
+        }
+        player["temporary_effects"].append(effect)
 
-        elif item_type == "buy_gun_back":
-            # Restore confiscated gun with original ammo
-            was_confiscated = player.get("gun_confiscated", False)
-
-            if was_confiscated:
-                player["gun_confiscated"] = False
-                # Restore original ammo and magazines from when gun was confiscated
-                restored_ammo = player.get("confiscated_ammo", 0)
-                restored_magazines = player.get("confiscated_magazines", 1)
-                player["current_ammo"] = restored_ammo
-                player["magazines"] = restored_magazines
-                # Clean up the stored values
-                player.pop("confiscated_ammo", None)
-                player.pop("confiscated_magazines", None)
+        return {
+            "type": "attract_ducks",
+            "spawn_multiplier": spawn_multiplier,
+            "duration": duration // 60,  # return duration in minutes
+        }
 
+    def _effect_clover_luck(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Temporarily boost hit + befriend success rates"""
+        if "temporary_effects" not in player or not isinstance(
+            player.get("temporary_effects"), list
+        ):
+            player["temporary_effects"] = []
+
+        duration = item.get("duration", 600)  # seconds
+        try:
+            duration = int(duration)
+        except (ValueError, TypeError):
+            duration = 600
+        duration = max(30, min(duration, 86400))
+
+        try:
+            min_hit = float(item.get("min_hit_chance", 0.95))
+        except (ValueError, TypeError):
+            min_hit = 0.95
+        try:
+            min_bef = float(item.get("min_befriend_chance", 0.95))
+        except (ValueError, TypeError):
+            min_bef = 0.95
+        min_hit = max(0.0, min(min_hit, 1.0))
+        min_bef = max(0.0, min(min_bef, 1.0))
+
+        now = time.time()
+        expires_at = now + duration
+
+        # If an existing clover effect is active, extend it instead of stacking.
+        for effect in player["temporary_effects"]:
+            if (
+                isinstance(effect, dict)
+                and effect.get("type") == "clover_luck"
+                and effect.get("expires_at", 0) > now
+            ):
+                effect["expires_at"] = (
+                    max(effect.get("expires_at", now), now) + duration
+                )
+                effect["min_hit_chance"] = max(
+                    float(effect.get("min_hit_chance", 0.0) or 0.0), min_hit
+                )
+                effect["min_befriend_chance"] = max(
+                    float(effect.get("min_befriend_chance", 0.0) or 0.0), min_bef
+                )
                 return {
-                    "type": "buy_gun_back",
-                    "restored": True,
-                    "ammo_restored": restored_ammo,
-                    "magazines_restored": restored_magazines,
-                }
-            else:
-                return {
-                    "type": "buy_gun_back",
-                    "restored": False,
-                    "message": "Your gun is not confiscated",
+                    "type": "clover_luck",
+                    "duration": duration // 60,
+                    "min_hit_chance": min_hit,
+                    "min_befriend_chance": min_bef,
+                    "extended": True,
                 }
 
-        elif item_type == "dry_clothes":
-            # Remove wet clothes effect
-
-            # Remove any wet clothes effects
-            if "temporary_effects" in player:
-                original_count = len(player["temporary_effects"])
-                player["temporary_effects"] = [
-                    effect
-                    for effect in player["temporary_effects"]
-                    if effect.get("type") != "wet_clothes"
-                ]
-                new_count = len(player["temporary_effects"])
-                was_wet = original_count > new_count
-            else:
-                was_wet = False
+        effect = {
+            "type": "clover_luck",
+            "min_hit_chance": min_hit,
+            "min_befriend_chance": min_bef,
+            "expires_at": expires_at,
+        }
+        player["temporary_effects"].append(effect)
 
-            return {
-                "type": "dry_clothes",
-                "was_wet": was_wet,
-                "message": "You changed into dry clothes!"
-                if was_wet
-                else "You weren't wet!",
-            }
+        return {
+            "type": "clover_luck",
+            "duration": duration // 60,
+            "min_hit_chance": min_hit,
+            "min_befriend_chance": min_bef,
+            "extended": False,
+        }
 
-        elif item_type == "reveal_duck":
-            return self._handle_reveal_duck(item)
+    def _effect_insurance(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Add insurance protection against friendly fire"""
+        if "temporary_effects" not in player:
+            player["temporary_effects"] = []
 
-        elif item_type == "second_chance":
-            return self._handle_second_chance(player, item)
+        duration = item.get("duration", 86400)  # 24 hours default
+        protection_type = item.get("protection", "friendly_fire")
 
-        elif item_type == "temporary_accuracy":
-            return self._handle_temporary_accuracy(player, item)
+        effect = {
+            "type": "insurance",
+            "protection": protection_type,
+            "expires_at": time.time() + duration,
+            "name": "Hunter's Insurance",
+        }
+        player["temporary_effects"].append(effect)
 
-        elif item_type == "trap":
-            return self._handle_trap(player, item)
+        return {
+            "type": "insurance",
+            "protection": protection_type,
+            "duration": duration // 3600,  # return duration in hours
+        }
 
-        elif item_type == "mystery":
-            return self._handle_mystery_box(player, item)
+    def _effect_buy_gun_back(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Restore confiscated gun with original ammo"""
+        was_confiscated = player.get("gun_confiscated", False)
+
+        if was_confiscated:
+            player["gun_confiscated"] = False
+            # Restore original ammo and magazines from when gun was confiscated
+            restored_ammo = player.get("confiscated_ammo", 0)
+            restored_magazines = player.get("confiscated_magazines", 1)
+            player["current_ammo"] = restored_ammo
+            player["magazines"] = restored_magazines
+            # Clean up the stored values
+            player.pop("confiscated_ammo", None)
+            player.pop("confiscated_magazines", None)
 
-        elif item_type == "xp_shield":
-            return self._handle_xp_shield(player, item)
+            return {
+                "type": "buy_gun_back",
+                "restored": True,
+                "ammo_restored": restored_ammo,
+                "magazines_restored": restored_magazines,
+            }
+        else:
+            return {
+                "type": "buy_gun_back",
+                "restored": False,
+                "message": "Your gun is not confiscated",
+            }
 
+    def _effect_dry_clothes(
+        self, player: dict, item: dict, buyer: Optional[dict] = None
+    ) -> dict:
+        """Remove wet clothes effect"""
+        # Remove any wet clothes effects
+        if "temporary_effects" in player:
+            original_count = len(player["temporary_effects"])
+            player["temporary_effects"] = [
+                effect
+                for effect in player["temporary_effects"]
+                if effect.get("type") != "wet_clothes"
+            ]
+            new_count = len(player["temporary_effects"])
+            was_wet = original_count > new_count
         else:
-            self.logger.warning(f"Unknown item type: {item_type}")
-            return {"type": "unknown", "message": f"Unknown effect type: {item_type}"}
+            was_wet = False
+
+        return {
+            "type": "dry_clothes",
+            "was_wet": was_wet,
+            "message": "You changed into dry clothes!"
+            if was_wet
+            else "You weren't wet!",
+        }
 
     # -------------------------------------------------------------------
     # New item type handlers
@@ -827,8 +922,6 @@ class ShopManager:
 
     def _handle_mystery_box(self, player: dict, item: dict) -> dict:
         """Mystery box — randomly applies one item effect from a weighted pool."""
-        import random
-
         pool = item.get("mystery_pool", [])
         if not pool:
             # Fallback pool using existing item IDs 1-3 if none configured
@@ -866,13 +959,12 @@ class ShopManager:
         self, target_player: Dict[str, Any], item: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Apply splash water effect to target player"""
-        # Load config directly without import issues
+        # Read config.json via the shared (cached) loader rather than re-parsing it per use
         config_path = os.path.join(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.json"
         )
         try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
+            config = load_config(config_path)
             wet_duration = config.get("gameplay", {}).get(
                 "wet_clothes_duration", 300
             )  # 5 minutes default
@@ -912,8 +1004,9 @@ class ShopManager:
 
         inventory = player.get("inventory", {})
         item_id_str = str(item_id)
+        count = inventory.get(item_id_str, 0)
 
-        if item_id_str not in inventory or inventory[item_id_str] <= 0:
+        if count <= 0:
             return {
                 "success": False,
                 "error": "not_in_inventory",
@@ -959,8 +1052,9 @@ class ShopManager:
             }
 
         # Remove item from inventory
-        inventory[item_id_str] -= 1
-        if inventory[item_id_str] <= 0:
+        if count > 1:
+            inventory[item_id_str] = count - 1
+        else:
             del inventory[item_id_str]
         player["inventory"] = inventory
 
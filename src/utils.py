@@ -3,6 +3,7 @@ Utility functions for DuckHunt Bot
 """
 
 import json
+import logging
 import os
 import random
 import re
@@ -16,6 +17,13 @@ class MessageManager:
         self.messages_file = messages_file
         self.command_prefix = command_prefix if command_prefix else "!"
         self.messages = {}
+        # Messages with colour and prefix placeholders already substituted (see
+        # _build_templates); only the per-call {nick}/{xp}/... fields remain
+        self._templates = {}
+        # (key, match) -> index of the first raw entry containing `match`, or None
+        self._match_index = {}
+        # The validated "colours" table, for callers that build their own output
+        self.colours = {}
         self.load_messages()
 
     def load_messages(self):
@@ -30,6 +38,41 @@ class MessageManager:
         except Exception as e:
             print(f"Error loading messages: {e}, using defaults")
             self.messages = self._get_default_messages()
+        self._build_templates()
+
+    def _resolve_static(self, message: str, colours: dict) -> str:
+        """Substitute the colour and command-prefix placeholders in one message."""
+        for color_name, color_code in colours.items():
+            message = message.replace("{" + color_name + "}", color_code)
+        # Replace the command-prefix placeholder so message text (help/usage
+        # strings etc.) always reflects the configured prefix instead of a
+        # hardcoded "!".
+        return message.replace("{prefix}", self.command_prefix)
+
+    def _build_templates(self):
+        """Pre-resolve every message's static placeholders once per load.
+
+        Colour codes and the command prefix never change between sends, so doing the
+        replacement here leaves get()/get_choice() with just the .format() call.
+        """
+        colours = self.messages.get("colours")
+        if not isinstance(colours, dict):
+            colours = {}
+        self.colours = colours
+        templates = {}
+        for key, message in self.messages.items():
+            if isinstance(message, str):
+                message = self._resolve_static(message, colours)
+            elif isinstance(message, list):
+                message = [
+                    self._resolve_static(entry, colours)
+                    if isinstance(entry, str)
+                    else entry
+                    for entry in message
+                ]
+            templates[key] = message
+        self._templates = templates
+        self._match_index = {}
 
     def _get_default_messages(self) -> Dict[str, Any]:
         """Default fallback messages without colors"""
@@ -74,10 +117,10 @@ class MessageManager:
     def get(self, key: str, **kwargs) -> str:
         """Get a formatted message by key with enhanced error handling"""
         try:
-            if key not in self.messages:
+            if key not in self._templates:
                 return f"[Missing message: {key}]"
 
-            message = self.messages[key]
+            message = self._templates[key]
 
             # If message is an array, randomly select one
             if isinstance(message, list):
@@ -89,19 +132,6 @@ class MessageManager:
             if not isinstance(message, str):
                 return f"[Invalid message type: {key}]"
 
-            # Replace color placeholders with IRC codes
-            if "colours" in self.messages and isinstance(
-                self.messages["colours"], dict
-            ):
-                for color_name, color_code in self.messages["colours"].items():
-                    placeholder = "{" + color_name + "}"
-                    message = message.replace(placeholder, color_code)
-
-            # Replace the command-prefix placeholder so message text (help/usage
-            # strings etc.) always reflects the configured prefix instead of a
-            # hardcoded "!".
-            message = message.replace("{prefix}", self.command_prefix)
-
             # Sanitize kwargs to prevent injection and ensure all values are safe
             safe_kwargs = {}
             for k, v in kwargs.items():
@@ -174,21 +204,33 @@ class MessageManager:
         If `match` is provided, returns the first list entry containing the substring.
         If `index` is provided, returns the entry at that index (if valid).
         Falls back to random choice when neither match nor index resolve.
-        The returned message is formatted the same as `get`.
+        The returned message is formatted the same as `get`, including `{prefix}`
+        always being the configured command prefix (a `prefix=` keyword is ignored).
         """
         try:
-            if key not in self.messages:
+            if key not in self._templates:
                 return f"[Missing message: {key}]"
 
-            message = self.messages[key]
+            message = self._templates[key]
 
             if isinstance(message, list):
+                # `match` is tested against the raw messages.json text, then the
+                # pre-resolved entry at the same position is used. The position is
+                # remembered, since callers pass the same match string every time.
                 chosen = None
                 if match:
-                    for entry in message:
-                        if match in (entry or ""):
-                            chosen = entry
-                            break
+                    cache_key = (key, match)
+                    if cache_key in self._match_index:
+                        pos = self._match_index[cache_key]
+                    else:
+                        pos = None
+                        for i, entry in enumerate(self.messages[key]):
+                            if match in (entry or ""):
+                                pos = i
+                                break
+                        self._match_index[cache_key] = pos
+                    if pos is not None:
+                        chosen = message[pos]
                 if chosen is None and index is not None:
                     try:
                         chosen = message[index]
@@ -202,16 +244,6 @@ class MessageManager:
                     )
                 message = chosen
 
-            # Delegate to existing formatting behavior by re-using get's internals
-            # We temporarily insert the resolved message into a small dict and call format logic.
-            # Replace color placeholders
-            if "colours" in self.messages and isinstance(
-                self.messages["colours"], dict
-            ):
-                for color_name, color_code in self.messages["colours"].items():
-                    placeholder = "{" + color_name + "}"
-                    message = message.replace(placeholder, color_code)
-
             safe_kwargs = {}
             for k, v in kwargs.items():
                 try:
@@ -296,44 +328,32 @@ def parse_irc_message(line: str) -> Tuple[str, str, List[str], str]:
 
         line = line.strip()
 
-        # Initialize return values
+        # Single forward pass: a cursor moves past the optional prefix, then one
+        # find() locates the trailing marker, and only the middle section is split.
         prefix = ""
-        trailing = ""
-        command = ""
-        params = []
-
-        # Handle prefix (starts with :)
-        if line.startswith(":"):
-            try:
-                if " " in line[1:]:
-                    prefix, line = line[1:].split(" ", 1)
-                else:
-                    # Handle malformed IRC line with no space after prefix
-                    prefix = line[1:]
-                    line = ""
-            except ValueError:
-                # If split fails, treat entire line as prefix
+        pos = 0
+        if line[0] == ":":
+            space = line.find(" ")
+            if space == -1:
+                # Malformed IRC line with no space after prefix
                 prefix = line[1:]
-                line = ""
+                pos = len(line)
+            else:
+                prefix = line[1:space]
+                pos = space + 1
 
         # Handle trailing parameter (starts with ' :')
-        if line and " :" in line:
-            try:
-                line, trailing = line.split(" :", 1)
-            except ValueError:
-                # If split fails, keep line as is
-                pass
+        marker = line.find(" :", pos)
+        if marker == -1:
+            parts = line[pos:].split()
+            trailing = ""
+        else:
+            parts = line[pos:marker].split()
+            trailing = line[marker + 2 :]
 
         # Parse command and parameters
-        if line:
-            try:
-                parts = line.split()
-                command = parts[0] if parts else ""
-                params = parts[1:] if len(parts) > 1 else []
-            except Exception:
-                # If parsing fails, try to extract at least the command
-                command = line.split()[0] if line.split() else ""
-                params = []
+        command = parts[0] if parts else ""
+        params = parts[1:]
 
         # Validate that we have at least a command
         if not command and not prefix:
@@ -345,8 +365,6 @@ def parse_irc_message(line: str) -> Tuple[str, str, List[str], str]:
 
     except Exception as e:
         # Log the error but return safe defaults to prevent crashes
-        import logging
-
         logger = logging.getLogger(__name__)
         logger.warning(f"Error parsing IRC message '{line[:50]}...': {e}")
         return "", "UNKNOWN", [], ""
@@ -6,7 +6,9 @@ IMPORTANT: These tests must never touch the real duckhunt.json. Every DuckDB
 instance created here is given an absolute path inside a TemporaryDirectory.
 """
 
+import asyncio
 import json
+import logging
 import os
 import sys
 import tempfile
@@ -14,9 +16,10 @@ import unittest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.config_loader import load_config
 from src.db import DuckDB
 from src.duckhuntbot import DuckHuntBot
-from src.error_handling import sanitize_user_input
+from src.error_handling import ErrorRecovery, sanitize_user_input
 from src.game import ACHIEVEMENTS, DuckGame
 from src.levels import LevelManager
 from src.shop import ShopManager
@@ -25,6 +28,31 @@ from src.utils import MessageManager, parse_irc_message
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
+def _bare_bot(**attrs):
+    """Build a DuckHuntBot without running __init__ (which would open the real DB).
+
+    Only a logger is set up front; each test passes the attributes it needs.
+    """
+    bot = object.__new__(DuckHuntBot)
+    bot.logger = logging.getLogger("test")
+    for name, value in attrs.items():
+        setattr(bot, name, value)
+    return bot
+
+
+class FakeWriter:
+    """Collects what the bot writes to its IRC connection."""
+
+    def __init__(self):
+        self.writes = []
+
+    def is_closing(self):
+        return False
+
+    def write(self, data):
+        self.writes.append(data)
+
+
 class TestParseIrcMessage(unittest.TestCase):
     def test_privmsg(self):
         prefix, command, params, trailing = parse_irc_message(
@@ -46,6 +74,54 @@ class TestParseIrcMessage(unittest.TestCase):
         parse_irc_message(":only-prefix")
 
 
+class TestConfigLoader(unittest.TestCase):
+    def test_reuses_parse_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "config.json")
+            with open(path, "w") as f:
+                json.dump({"connection": {"nick": "a"}}, f)
+            first = load_config(path)
+            self.assertIs(load_config(path), first)
+
+            with open(path, "w") as f:
+                json.dump({"connection": {"nick": "b"}}, f)
+            st = os.stat(path)
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+            self.assertEqual(load_config(path)["connection"]["nick"], "b")
+
+    def test_missing_file_raises(self):
+        with self.assertRaises(FileNotFoundError):
+            load_config("/nonexistent/config.json")
+
+    def test_empty_file_raises(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "config.json")
+            open(path, "w").close()
+            with self.assertRaises(ValueError):
+                load_config(path)
+
+
+class TestQueuedFileLogging(unittest.TestCase):
+    def test_stop_file_listeners_flushes_queued_records(self):
+        from src import logging_utils
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "t.log")
+            handler = logging.FileHandler(path, encoding="utf-8")
+            logger = logging.getLogger("test.queued")
+            logger.setLevel(logging.INFO)
+            logging_utils._attach_queued_handler(logger, handler, logging.INFO)
+            try:
+                logger.info("last words before execv")
+                logging_utils.stop_file_listeners()
+            finally:
+                for h in list(logger.handlers):
+                    logger.removeHandler(h)
+                handler.close()
+            with open(path, encoding="utf-8") as f:
+                self.assertIn("last words before execv", f.read())
+
+
 class TestSanitize(unittest.TestCase):
     def test_strips_newlines(self):
         self.assertNotIn("\n", sanitize_user_input("a\r\nb"))
@@ -80,6 +156,28 @@ class TestMessages(unittest.TestCase):
         mm = MessageManager("/nonexistent/messages.json", command_prefix="@")
         self.assertIn("@reload", mm.get("bang_no_ammo", nick="x"))
 
+    def test_get_choice_match_uses_resolved_entry(self):
+        mm = MessageManager("/nonexistent/messages.json")
+        mm.messages = {
+            "colours": {"red": "\x0304"},
+            "greet": ["{red}hi {nick}", "{red}bye {nick}"],
+        }
+        mm._build_templates()
+        self.assertEqual(mm.get_choice("greet", match="bye", nick="x"), "\x0304bye x")
+        # The remembered match position is dropped when messages are rebuilt
+        mm.messages["greet"] = ["bye {nick}"]
+        mm._build_templates()
+        self.assertEqual(mm.get_choice("greet", match="bye", nick="x"), "bye x")
+
+    def test_prefix_is_resolved_the_same_by_get_and_get_choice(self):
+        mm = MessageManager("/nonexistent/messages.json", command_prefix="?")
+        mm.messages = {"usage": "Type {prefix}bang", "spawn": ["Use {prefix}bang"]}
+        mm._build_templates()
+        self.assertEqual(mm.get("usage"), "Type ?bang")
+        self.assertEqual(mm.get("usage", prefix="!"), "Type ?bang")
+        self.assertEqual(mm.get_choice("spawn", index=0), "Use ?bang")
+        self.assertEqual(mm.get_choice("spawn", index=0, prefix="!"), "Use ?bang")
+
 
 class TestLevels(unittest.TestCase):
     def test_no_free_ammo_on_level_recalc(self):
@@ -102,6 +200,19 @@ class TestShop(unittest.TestCase):
     def setUp(self):
         self.shop = ShopManager("/nonexistent/shop.json", LevelManager("/nonexistent/levels.json"))
 
+    def test_item_views_match_item_table(self):
+        ids = [item_id for item_id, _item in self.shop.sorted_items()]
+        self.assertEqual(ids, sorted(self.shop.items))
+        self.assertEqual(self.shop.item_ids, {str(i) for i in self.shop.items})
+        with self.assertRaises(TypeError):
+            self.shop.get_items()[1] = {}
+
+    def test_every_item_type_has_an_effect(self):
+        for item in self.shop.items.values():
+            self.assertIn(item["type"], self.shop._effect_handlers)
+        result = self.shop._apply_item_effect({}, {"type": "no_such_effect"})
+        self.assertEqual(result["type"], "unknown")
+
     def test_purchase_insufficient_xp(self):
         player = {"xp": 0, "inventory": {}}
         result = self.shop.purchase_item(player, 1, store_in_inventory=True)
@@ -162,6 +273,136 @@ class TestDatabasePersistence(unittest.TestCase):
             self.assertEqual(reloaded["luck_bonus"], 7)
             self.assertEqual(reloaded["critical_chance"], 3)
 
+    def test_incremental_save_is_replayed_on_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "test-duckhunt.json")
+
+            db = DuckDB(db_file=db_path)
+            db.get_player("hunter", "#ducks")["xp"] = 10
+            db.get_player("other", "#ducks")["xp"] = 5
+            self.assertTrue(db.save_database())  # first save: full snapshot
+            db.get_player("hunter", "#ducks")["xp"] = 20
+            self.assertTrue(db.save_database())  # journals only "hunter"
+            db.flush_pending_saves(timeout=10.0)
+
+            with open(db_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            self.assertEqual(
+                snapshot["channels"]["#ducks"]["players"]["hunter"]["xp"], 10
+            )
+            with open(f"{db_path}.journal", encoding="utf-8") as f:
+                batches = [json.loads(line) for line in f if line.strip()]
+            self.assertEqual(len(batches), 1)
+            self.assertEqual([e["nick"] for e in batches[0]["entries"]], ["hunter"])
+
+            db2 = DuckDB(db_file=db_path)
+            self.assertEqual(db2.get_player_if_exists("hunter", "#ducks")["xp"], 20)
+            self.assertEqual(db2.get_player_if_exists("other", "#ducks")["xp"], 5)
+
+    def test_torn_journal_batch_is_skipped_whole(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "test-duckhunt.json")
+
+            db = DuckDB(db_file=db_path)
+            db.get_player("giver", "#ducks")["xp"] = 10
+            db.get_player("taker", "#ducks")["xp"] = 10
+            self.assertTrue(db.save_database())  # full snapshot
+            db.get_player("giver", "#ducks")["xp"] = 5
+            db.get_player("taker", "#ducks")["xp"] = 15
+            self.assertTrue(db.save_database())  # one batch with both players
+            db.flush_pending_saves(timeout=10.0)
+
+            # Simulate a crash partway through writing that batch
+            with open(f"{db_path}.journal", "rb") as f:
+                journal = f.read()
+            with open(f"{db_path}.journal", "wb") as f:
+                f.write(journal[: len(journal) * 2 // 3])
+
+            db2 = DuckDB(db_file=db_path)
+            self.assertEqual(db2.get_player_if_exists("giver", "#ducks")["xp"], 10)
+            self.assertEqual(db2.get_player_if_exists("taker", "#ducks")["xp"], 10)
+
+    def test_backup_recovery_replays_its_journal(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "test-duckhunt.json")
+
+            db = DuckDB(db_file=db_path)
+            db.get_player("hunter", "#ducks")["xp"] = 10
+            self.assertTrue(db.save_database())  # snapshot A
+            db.get_player("hunter", "#ducks")["xp"] = 20
+            self.assertTrue(db.save_database())  # journaled on top of A
+            db._journal_saves = db.journal_snapshot_every
+            db.get_player("hunter", "#ducks")["xp"] = 30
+            self.assertTrue(db.save_database())  # snapshot B; A moves to .bak
+            db.flush_pending_saves(timeout=10.0)
+
+            with open(db_path, "w", encoding="utf-8") as f:
+                f.write("{not json")
+            db2 = DuckDB(db_file=db_path)
+            # A plus its journal, not the bare snapshot A
+            self.assertEqual(db2.get_player_if_exists("hunter", "#ducks")["xp"], 20)
+
+    def test_get_player_reuses_validated_record(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DuckDB(db_file=os.path.join(tmp, "t.json"))
+            player = db.get_player("hunter", "#ducks")
+            player["xp"] = 42
+            again = db.get_player("Hunter", "#DUCKS")
+            self.assertIs(again, player)
+            self.assertEqual(again["xp"], 42)
+            self.assertEqual(again["nick"], "Hunter")
+
+    def test_new_players_do_not_share_containers(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DuckDB(db_file=os.path.join(tmp, "t.json"))
+            a = db.create_player("a")
+            b = db.create_player("b")
+            a["inventory"]["1"] = 2
+            a["achievements"].append({"id": "first_blood"})
+            self.assertEqual(b["inventory"], {})
+            self.assertEqual(b["achievements"], [])
+            self.assertEqual(b["nick"], "b")
+
+    def test_request_save_coalesces_while_saver_runs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DuckDB(db_file=os.path.join(tmp, "t.json"))
+            db.save_delay = 0.01
+            calls = []
+            db.save_database = lambda: calls.append(1) or True
+
+            async def scenario():
+                task = asyncio.create_task(db.saver_loop())
+                await asyncio.sleep(0)
+                for _ in range(5):
+                    db.request_save()
+                await asyncio.sleep(0.1)
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+            asyncio.run(scenario())
+            self.assertEqual(len(calls), 1)
+            db.request_save()  # no saver running: saves immediately
+            self.assertEqual(len(calls), 2)
+
+    def test_leaderboard_orders_top_entries(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DuckDB(db_file=os.path.join(tmp, "t.json"))
+            for nick, xp in (("a", 5), ("b", 50), ("c", 20), ("d", 50), ("e", 1)):
+                db.get_player(nick, "#ducks")["xp"] = xp
+            self.assertEqual(
+                db.get_leaderboard("#ducks", "xp", 3), [("b", 50), ("d", 50), ("c", 20)]
+            )
+
+    def test_is_ignored_channel_and_global(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            db = DuckDB(db_file=os.path.join(tmp, "t.json"))
+            db.get_player("Spammer", "#ducks")["ignored"] = True
+            self.assertTrue(db.is_ignored("SPAMMER", "#Ducks"))
+            self.assertFalse(db.is_ignored("spammer", "#other"))
+            db.set_global_ignored("troll", True)
+            self.assertTrue(db.is_ignored("Troll", "#other"))
+            self.assertFalse(db.is_ignored("nobody", "#ducks"))
+
     def test_sanitize_does_not_wipe_stats(self):
         with tempfile.TemporaryDirectory() as tmp:
             db = DuckDB(db_file=os.path.join(tmp, "t.json"))
@@ -172,8 +413,7 @@ class TestDatabasePersistence(unittest.TestCase):
 
 class TestCommandTable(unittest.TestCase):
     def test_table_covers_all_commands(self):
-        # Build the table without running __init__ (which would open the real DB)
-        bot = object.__new__(DuckHuntBot)
+        bot = _bare_bot()
         table = DuckHuntBot._build_command_table(bot)
         expected = {
             "bang", "bef", "befriend", "reload", "shop", "duckstats", "topduck",
@@ -188,12 +428,155 @@ class TestCommandTable(unittest.TestCase):
             {"rearm", "disarm", "ignore", "unignore", "ducklaunch", "join", "part"},
         )
 
+    def test_irc_table_dispatches_ping(self):
+        bot = _bare_bot()
+        bot.irc_handlers = bot._build_irc_table()
+        for command in ("CAP", "AUTHENTICATE", "001", "433", "474", "903", "PRIVMSG"):
+            self.assertIn(command, bot.irc_handlers)
+        lines = []
+        bot.send_raw = lines.append
+        asyncio.run(bot.handle_message("", "PING", [], "irc.example.net"))
+        asyncio.run(bot.handle_message("", "NOTICE", ["*"], "ignored"))
+        self.assertEqual(lines, ["PONG :irc.example.net"])
+
+
+class TestIsAdmin(unittest.TestCase):
+    def test_nick_only_and_hostmask_entries(self):
+        admins = ["Colby", {"nick": "op", "hostmask": "op!*@trusted.host"}]
+        bot = _bare_bot(config={"admins": admins})
+        self.assertTrue(bot.is_admin("colby!u@anywhere"))
+        self.assertTrue(bot.is_admin("OP!ident@Trusted.Host"))
+        self.assertFalse(bot.is_admin("op!ident@evil.host"))
+        self.assertFalse(bot.is_admin("stranger!u@h"))
+        self.assertFalse(bot.is_admin("colby"))
+
+    def test_config_reassignment_rebuilds_admin_rules(self):
+        bot = _bare_bot(config={"admins": ["Colby"]})
+        bot.config = {"admins": [{"nick": "op", "hostmask": "op!*@trusted.host"}]}
+        self.assertFalse(bot.is_admin("colby!u@anywhere"))
+        self.assertTrue(bot.is_admin("op!ident@trusted.host"))
+        self.assertEqual(bot.admins, frozenset({"op"}))
+
+
+class TestGetConfig(unittest.TestCase):
+    def test_cached_paths_respect_defaults_and_reassignment(self):
+        bot = _bare_bot(config={"duck_types": {"fast": {"timeout": 20}}})
+        self.assertEqual(bot.get_config("duck_types.fast.timeout", 60), 20)
+        self.assertEqual(bot.get_config("duck_types.fast.timeout", 60), 20)
+        self.assertIsNone(bot.get_config("duck_types.golden.timeout"))
+        self.assertEqual(bot.get_config("duck_types.golden.timeout", 7), 7)
+        bot.config = {"duck_types": {"fast": {"timeout": 5}}}
+        self.assertEqual(bot.get_config("duck_types.fast.timeout", 60), 5)
+
+
+class TestSendRawLines(unittest.TestCase):
+    def test_lines_go_out_in_one_write(self):
+        bot = _bare_bot(writer=FakeWriter())
+        self.assertTrue(bot.send_raw_lines(["NICK duck", "USER duck 0 * :duck"]))
+        self.assertEqual(
+            bot.writer.writes, [b"NICK duck\r\nUSER duck 0 * :duck\r\n"]
+        )
+
+
+class TestMessageLoop(unittest.TestCase):
+    def test_ping_answered_from_raw_line(self):
+        class FakeReader:
+            def __init__(self, lines):
+                self.lines = list(lines)
+
+            async def readline(self):
+                return self.lines.pop(0) if self.lines else b""
+
+        bot = _bare_bot(
+            shutdown_requested=False,
+            reader=FakeReader([b"PING :irc.example.net\r\n"]),
+            writer=FakeWriter(),
+        )
+        asyncio.run(bot.message_loop())
+        self.assertEqual(bot.writer.writes, [b"PONG :irc.example.net\r\n"])
+
+
+class TestSendMessages(unittest.TestCase):
+    def test_lines_sent_in_order_from_one_task(self):
+        bot = _bare_bot(error_recovery=ErrorRecovery(), _background_tasks=set())
+        sent = []
+
+        async def fake_impl(target, msg):
+            sent.append((target, msg))
+            return True
+
+        bot._send_message_impl = fake_impl
+        tasks = []
+        track_task = bot._track_task
+        bot._track_task = lambda *a, **kw: tasks.append(track_task(*a, **kw))
+
+        async def scenario():
+            self.assertTrue(bot.send_messages("nick", ["a", "b", "c"]))
+            # One task for all lines (it may already be done if started eagerly)
+            self.assertEqual(len(tasks), 1)
+            await asyncio.gather(*tasks)
+
+        asyncio.run(scenario())
+        self.assertEqual(sent, [("nick", "a"), ("nick", "b"), ("nick", "c")])
+
+
+class TestEagerSendTasks(unittest.TestCase):
+    def _bot(self, send_gap_secs=0.0):
+        return _bare_bot(
+            error_recovery=ErrorRecovery(),
+            _background_tasks=set(),
+            _last_chat_send=0.0,
+            _send_gap_secs=send_gap_secs,
+        )
+
+    def test_only_message_tasks_use_the_eager_factory(self):
+        from unittest import mock
+
+        import src.duckhuntbot as bot_module
+
+        bot = self._bot()
+        eager_calls = []
+
+        def fake_factory(loop, coro):
+            eager_calls.append(coro)
+            return loop.create_task(coro)
+
+        async def control():
+            return None
+
+        async def scenario():
+            # Created here: before 3.10 an asyncio.Lock binds to the current loop
+            bot._send_pacer_lock = asyncio.Lock()
+            with mock.patch.object(bot_module, "_EAGER_TASK_FACTORY", fake_factory):
+                bot.send_notices("nick", ["a"])
+                bot._track_task(control())
+                await asyncio.gather(*bot._background_tasks)
+
+        bot.send_raw = lambda line: True
+        asyncio.run(scenario())
+        self.assertEqual(len(eager_calls), 1)
+
+    @unittest.skipUnless(
+        hasattr(asyncio, "eager_task_factory"), "eager tasks need Python 3.12+"
+    )
+    def test_eager_sends_keep_their_order(self):
+        bot = self._bot(send_gap_secs=0.01)
+        sent = []
+        bot.send_raw = lambda line: sent.append(line) or True
+
+        async def scenario():
+            bot._send_pacer_lock = asyncio.Lock()
+            for i in range(5):
+                bot.send_notices("nick", [f"line {i}"])
+            await asyncio.gather(*bot._background_tasks)
+
+        asyncio.run(scenario())
+        self.assertEqual(sent, [f"NOTICE nick :line {i}" for i in range(5)])
+
 
 class TestAchievements(unittest.TestCase):
     def _game(self):
         game = object.__new__(DuckGame)
-        import logging
-
         game.logger = logging.getLogger("test")
         return game
 